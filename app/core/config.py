@@ -1,4 +1,7 @@
 import os
+from functools import lru_cache
+from typing import Optional
+
 from pydantic import BaseSettings, Field
 
 
@@ -19,6 +22,8 @@ class Settings(BaseSettings):
 
     # JWT Authentication
     JWT_SECRET_KEY: str = Field(default="b94d27b9934d3e08a52e52d7da7dabfac484efe37a5380ee9088f7ace2efcde9", env="JWT_SECRET")
+    # Optional Secrets Manager id/ARN; when set it takes precedence over JWT_SECRET_KEY
+    JWT_SECRET_ID: Optional[str] = Field(default=None, env="JWT_SECRET_ID")
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
 
@@ -31,4 +36,36 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the settings on first use and reuse the same instance afterwards."""
+    return Settings()
+
+
+def _secretsmanager_client(region: str):
+    import boto3
+
+    return boto3.client("secretsmanager", region_name=region)
+
+
+@lru_cache(maxsize=1)
+def get_jwt_secret() -> str:
+    """
+    Resolve the JWT signing key once; the app lifespan calls this at startup.
+    Fetched from Secrets Manager only when JWT_SECRET_ID is configured, so
+    processes that never sign or verify a token skip the round trip.
+    """
+    current = get_settings()
+    if not current.JWT_SECRET_ID:
+        return current.JWT_SECRET_KEY
+
+    client = _secretsmanager_client(current.DYNAMO_REGION)
+    return client.get_secret_value(SecretId=current.JWT_SECRET_ID)["SecretString"]
+
+
+def __getattr__(name: str):
+    # Keep `from app.core.config import settings` working without parsing the
+    # environment when this module is imported.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
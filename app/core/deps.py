@@ -0,0 +1,37 @@
+"""
+Dependencies
+Request dependencies shared across routers
+"""
+from functools import lru_cache
+
+from fastapi import HTTPException, Request, status
+
+from app.core.config import get_settings
+from app.core.security import decode_access_token_cached
+from app.utils.analyzer import FinanceAnalyzer
+
+_BEARER_PREFIX = "Bearer "
+_BEARER_PREFIX_LEN = len(_BEARER_PREFIX)
+
+
+async def get_current_user_id(request: Request) -> str:
+    """Extract user_id from the request's bearer token."""
+    # Reading the header directly skips FastAPI's per-request Header() validation;
+    # the dependency is async because a (usually cached) decode is too cheap to
+    # be worth a worker-thread hop. The JWT key is resolved in the app lifespan,
+    # so a cache miss never reaches Secrets Manager from here
+    authorization = request.headers.get("authorization")
+    if not authorization or not authorization.startswith(_BEARER_PREFIX):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token required")
+
+    payload = decode_access_token_cached(authorization[_BEARER_PREFIX_LEN:])
+    user_id = payload.get("sub")
+    if not user_id:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+    return user_id
+
+
+@lru_cache(maxsize=1)
+def get_finance_analyzer() -> FinanceAnalyzer:
+    """Analyzer shared by the routers, built with the file thresholds on first use."""
+    return FinanceAnalyzer(get_settings().BUDGET_THRESHOLDS_JSON)
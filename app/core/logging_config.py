@@ -0,0 +1,38 @@
+"""
+Logging Setup
+Sends application log records through a queue so request threads never block on log I/O
+"""
+import logging
+import logging.handlers
+import queue
+
+APP_LOGGER_NAME = "app"
+
+
+def start_log_listener() -> logging.handlers.QueueListener:
+    """
+    Attach a QueueHandler to the `app` logger and start a background listener
+    that writes the queued records to stderr. Call `stop_log_listener` on shutdown.
+    """
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    app_logger = logging.getLogger(APP_LOGGER_NAME)
+    app_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    # Records are emitted once, by the listener thread
+    app_logger.propagate = False
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def stop_log_listener(listener: logging.handlers.QueueListener) -> None:
+    """Flush pending records and detach the queue handler from the `app` logger."""
+    listener.stop()
+    app_logger = logging.getLogger(APP_LOGGER_NAME)
+    for handler in list(app_logger.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            app_logger.removeHandler(handler)
+    app_logger.propagate = True
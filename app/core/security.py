@@ -1,10 +1,13 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status
-from app.core.config import settings
+from app.core.config import get_jwt_secret, get_settings
+from app.utils.ttl_cache import TTLCache
 
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -12,6 +15,7 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hash."""
+    # Deliberately uncached: every check pays bcrypt's full work factor
     return pwd_context.verify(plain_password, hashed_password)
 
 
@@ -26,16 +30,16 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     `data` must include a unique identifier like user_id or email.
     """
     to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES))
+    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=get_settings().JWT_ACCESS_TOKEN_EXPIRE_MINUTES))
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, get_jwt_secret(), algorithm=get_settings().JWT_ALGORITHM)
     return encoded_jwt
 
 
 def decode_access_token(token: str) -> dict:
     """Decode and validate a JWT access token."""
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+        payload = jwt.decode(token, get_jwt_secret(), algorithms=[get_settings().JWT_ALGORITHM])
         return payload
     except JWTError:
         raise HTTPException(
@@ -43,3 +47,20 @@ def decode_access_token(token: str) -> dict:
             detail="Invalid or expired access token",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+
+# Verified payloads by token digest. Clients send the same token on every call,
+# so the HMAC check and JSON parse run once per token every 30 seconds.
+_decoded_tokens = TTLCache(ttl=30, maxsize=50_000)
+
+
+def decode_access_token_cached(token: str) -> dict:
+    """Like decode_access_token, but reuses recently verified payloads."""
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = _decoded_tokens.get(cache_key)
+    # A cached payload may outlive its token by up to the cache TTL; re-decode
+    # (and so reject) once `exp` has passed
+    if payload is None or payload.get("exp", float("inf")) <= time.time():
+        payload = decode_access_token(token)
+        _decoded_tokens.set(cache_key, payload)
+    return payload
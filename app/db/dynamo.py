@@ -1,101 +1,243 @@
+"""
+DynamoDB Access Layer
+Single home for the process-wide DynamoDB resource and all table operations.
+Other modules call these helpers instead of creating their own boto3 resources.
+"""
+import logging
 from decimal import Decimal
-from typing import Any, Optional
-from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional, Sequence
 
 import boto3
+import orjson
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
-from app.core.config import settings
+from app.core.config import get_settings
+from app.utils.timestamps import utc_now_iso_seconds
+from app.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Shared connection pool for every DynamoDB call in the process: keep-alive sockets
+# avoid a TLS handshake per request and the larger pool lets concurrent handlers
+# issue requests without queueing on the default 10 connections.
+DYNAMO_MAX_POOL_CONNECTIONS = 64
+
+# Hot reads call the low-level client with pre-built expression strings, which
+# skips the Table resource layer and condition-builder compilation per call
+_EMAIL_INDEX = "email-index"  # You must create this GSI manually
+_EXPENSES_BY_MONTH = "user_id = :user_id AND begins_with(expense_id, :month_prefix)"
+
+# Sparse GSI over users with the scheduler enabled. Only items carrying
+# SCHEDULER_ENABLED_INDEX_KEY are projected into it, so the attribute is written
+# when a user enables the scheduler and removed when they disable it.
+SCHEDULER_ENABLED_INDEX = "scheduler-enabled-index"
+SCHEDULER_ENABLED_INDEX_KEY = "scheduler_enabled_key"
+SCHEDULER_ENABLED_INDEX_VALUE = "true"
+
+
+@lru_cache(maxsize=1)
+def _resource():
+    """Create the DynamoDB resource on first use; every call after that reuses it."""
+    config = Config(
+        region_name=get_settings().DYNAMO_REGION,
+        tcp_keepalive=True,
+        max_pool_connections=DYNAMO_MAX_POOL_CONNECTIONS,
+        retries={"max_attempts": 5, "mode": "adaptive"},
+    )
+    # A dedicated session keeps this resource independent of boto3's global
+    # default session, which other modules also use from worker threads
+    return boto3.session.Session().resource("dynamodb", config=config)
+
+
+@lru_cache(maxsize=1)
+def _client():
+    """
+    Client behind the shared resource. It keeps the resource's type handling,
+    so parameters and results are plain Python values, not wire-format dicts.
+    """
+    return _resource().meta.client
+
+
+def warm_up():
+    """
+    Build the shared client and open a pooled connection ahead of the first request,
+    so credential resolution, service-model loading and the TLS handshake don't land
+    on a user's call. Failures are only logged; real calls retry on their own.
+    """
+    try:
+        _client().describe_endpoints()
+    except Exception as e:
+        logger.warning("DynamoDB warm-up failed: %s", e)
+
+
+def table_status(table_name: str) -> str:
+    """
+    TableStatus from DescribeTable (e.g. ACTIVE). A control-plane call that
+    consumes no read capacity, meant for health checks. ClientError propagates.
+    """
+    return _client().describe_table(TableName=table_name)["Table"]["TableStatus"]
+
 
-# Initialize DynamoDB resource
-dynamodb = boto3.resource("dynamodb", region_name=settings.DYNAMO_REGION)
+@lru_cache(maxsize=1)
+def users_table():
+    """Users table handle, bound to the shared resource."""
+    return _resource().Table(get_settings().DYNAMO_USERS_TABLE)
 
-# Get table references
-users_table = dynamodb.Table(settings.DYNAMO_USERS_TABLE)
-expenses_table = dynamodb.Table(settings.DYNAMO_EXPENSES_TABLE)
+
+@lru_cache(maxsize=1)
+def expenses_table():
+    """Expenses table handle, bound to the shared resource."""
+    return _resource().Table(get_settings().DYNAMO_EXPENSES_TABLE)
+
+
+def _iter_query(table_name: str, **query_kwargs):
+    """
+    Yield every item of a Query page by page, following LastEvaluatedKey.
+    DynamoDB caps a single response at 1 MB, so one call can silently truncate.
+    Only one page is held in memory at a time.
+    """
+    paginator = _client().get_paginator("query")
+    for page in paginator.paginate(TableName=table_name, **query_kwargs):
+        yield from page["Items"]
+
+
+def _query_all(table_name: str, **query_kwargs):
+    """Run a Query to completion and return all items as a list."""
+    return list(_iter_query(table_name, **query_kwargs))
+
+
+# Logins resolve the same email repeatedly; serve them from memory for a minute
+# instead of querying the email GSI each time. Misses are never cached, so a
+# freshly registered user is found immediately.
+_users_by_email_cache = TTLCache(ttl=60, maxsize=10_000)
+_USER_PROJECTION = "user_id, email, password_hash, created_at, profile_image_url"
 
 
 def get_user_by_email(email: str):
     """Query the Users table by email (assumes a GSI exists on email)."""
+    return _users_by_email_cache.get_or_load(email, lambda: _fetch_user_by_email(email))
+
+
+def _fetch_user_by_email(email: str):
     try:
-        response = users_table.query(
-            IndexName="email-index",  # You must create this GSI manually
-            KeyConditionExpression=boto3.dynamodb.conditions.Key("email").eq(email)
+        response = _client().query(
+            TableName=get_settings().DYNAMO_USERS_TABLE,
+            IndexName=_EMAIL_INDEX,
+            KeyConditionExpression="email = :email",
+            ExpressionAttributeValues={":email": email},
+            ProjectionExpression=_USER_PROJECTION,
+            # Emails are unique; stop at the first match instead of reading on
+            Limit=1,
         )
-        return _from_dynamo(response["Items"][0]) if response["Items"] else None
+        return _from_dynamo_item(response["Items"][0]) if response["Items"] else None
     except ClientError as e:
-        print(f"[ERROR] get_user_by_email failed: {e.response['Error']['Message']}")
+        logger.error("get_user_by_email failed: %s", e.response["Error"]["Message"])
         return None
 
 
 def get_user_by_id(user_id: str):
     """Get user by user_id from the Users table."""
     try:
-        response = users_table.get_item(Key={"user_id": user_id})
+        response = _client().get_item(
+            TableName=get_settings().DYNAMO_USERS_TABLE,
+            Key={"user_id": user_id},
+        )
         item = response.get("Item")
-        return _from_dynamo(item) if item else None
+        return _from_dynamo_item(item) if item else None
     except ClientError as e:
-        print(f"[ERROR] get_user_by_id failed: {e.response['Error']['Message']}")
+        logger.error("get_user_by_id failed: %s", e.response["Error"]["Message"])
         return None
 
 
 def put_user(user_item: dict):
     """Insert a new user into the Users table."""
     try:
-        users_table.put_item(Item=_convert_for_dynamo(user_item))
+        users_table().put_item(Item=_convert_for_dynamo(user_item))
+        _users_by_email_cache.pop(user_item.get("email"))
         return True
     except ClientError as e:
-        print(f"[ERROR] put_user failed: {e.response['Error']['Message']}")
+        logger.error("put_user failed: %s", e.response["Error"]["Message"])
         return False
 
 
 def put_expense(expense_item: dict):
     """Insert or update an expense for a user."""
     try:
-        expenses_table.put_item(Item=_convert_for_dynamo(expense_item))
+        expenses_table().put_item(Item=_convert_for_dynamo(expense_item))
         return True
     except ClientError as e:
-        print(f"[ERROR] put_expense failed: {e.response['Error']['Message']}")
+        logger.error("put_expense failed: %s", e.response["Error"]["Message"])
         return False
 
 
-def get_expenses_for_user(user_id: str, month_prefix: str):
+@lru_cache(maxsize=32)
+def _expense_projection(attributes: tuple) -> tuple:
+    """ProjectionExpression and name placeholders for `attributes` (some, like timestamp, are reserved words)."""
+    names = {f"#a{i}": attribute for i, attribute in enumerate(attributes)}
+    return ", ".join(names), names
+
+
+def iter_expenses_for_user(user_id: str, month_prefix: str, attributes: Optional[Sequence[str]] = None):
+    """
+    Yield all expenses for a given user and month item by item, reading one
+    query page at a time.
+    month_prefix: '2024-11' matches all items with SK like '2024-11-01T...'
+    attributes: fetch only these fields; by default whole items are returned,
+    since the monthly listing passes them straight through to the API response.
+    ClientError is raised to the caller.
+    """
+    query_kwargs = {}
+    if attributes:
+        projection, names = _expense_projection(tuple(attributes))
+        query_kwargs = {"ProjectionExpression": projection, "ExpressionAttributeNames": names}
+    for item in _iter_query(
+        get_settings().DYNAMO_EXPENSES_TABLE,
+        KeyConditionExpression=_EXPENSES_BY_MONTH,
+        ExpressionAttributeValues={":user_id": user_id, ":month_prefix": month_prefix},
+        **query_kwargs,
+    ):
+        yield _from_dynamo_item(item)
+
+
+def get_expenses_for_user(user_id: str, month_prefix: str, attributes: Optional[Sequence[str]] = None):
     """
     Query all expenses for a given user and month.
     month_prefix: '2024-11' matches all items with SK like '2024-11-01T...'
     """
     try:
-        response = expenses_table.query(
-            KeyConditionExpression=boto3.dynamodb.conditions.Key("user_id").eq(user_id) &
-                                   boto3.dynamodb.conditions.Key("expense_id").begins_with(month_prefix)
-        )
-        return [_from_dynamo(item) for item in response["Items"]]
+        return list(iter_expenses_for_user(user_id, month_prefix, attributes))
     except ClientError as e:
-        print(f"[ERROR] get_expenses_for_user failed: {e.response['Error']['Message']}")
+        logger.error("get_expenses_for_user failed: %s", e.response["Error"]["Message"])
         return []
 
 
 def delete_expense(user_id: str, expense_id: str):
     """Delete a specific expense item."""
     try:
-        response = expenses_table.delete_item(
+        response = expenses_table().delete_item(
             Key={"user_id": user_id, "expense_id": expense_id},
             ReturnValues="ALL_OLD",
         )
         return "Attributes" in response
     except ClientError as e:
-        print(f"[ERROR] delete_expense failed: {e.response['Error']['Message']}")
+        logger.error("delete_expense failed: %s", e.response["Error"]["Message"])
         return False
 
 
 def get_expense(user_id: str, expense_id: str):
     """Fetch a single expense item."""
     try:
-        response = expenses_table.get_item(Key={"user_id": user_id, "expense_id": expense_id})
+        response = _client().get_item(
+            TableName=get_settings().DYNAMO_EXPENSES_TABLE,
+            Key={"user_id": user_id, "expense_id": expense_id},
+        )
         item = response.get("Item")
-        return _from_dynamo(item) if item else None
+        return _from_dynamo_item(item) if item else None
     except ClientError as e:
-        print(f"[ERROR] get_expense failed: {e.response['Error']['Message']}")
+        logger.error("get_expense failed: %s", e.response["Error"]["Message"])
         return None
 
 
@@ -106,44 +248,64 @@ def update_expense(user_id: str, expense_id: str, updates: dict):
     if not updates:
         return None
 
-    update_expression_parts = []
-    expression_attribute_values = {}
     expression_attribute_names = {}
-
+    expression_attribute_values = {}
     for idx, (key, value) in enumerate(updates.items()):
-        placeholder = f"#f{idx}"
-        value_placeholder = f":v{idx}"
-        update_expression_parts.append(f"{placeholder} = {value_placeholder}")
-        expression_attribute_names[placeholder] = key
-        expression_attribute_values[value_placeholder] = value
+        expression_attribute_names[f"#f{idx}"] = key
+        # Convert each value here (scalars pass straight through) instead of
+        # re-walking the whole values dict afterwards
+        expression_attribute_values[f":v{idx}"] = (
+            _convert_for_dynamo(value) if type(value) in _TO_DYNAMO_TYPES else value
+        )
 
-    update_expression = "SET " + ", ".join(update_expression_parts)
+    update_expression = "SET " + ", ".join(f"#f{idx} = :v{idx}" for idx in range(len(updates)))
 
     try:
-        response = expenses_table.update_item(
+        response = expenses_table().update_item(
             Key={"user_id": user_id, "expense_id": expense_id},
             UpdateExpression=update_expression,
             ExpressionAttributeNames=expression_attribute_names,
-            ExpressionAttributeValues=_convert_for_dynamo(expression_attribute_values),
+            ExpressionAttributeValues=expression_attribute_values,
             ReturnValues="ALL_NEW",
         )
         attributes = response.get("Attributes")
-        return _from_dynamo(attributes) if attributes else None
+        return _from_dynamo_item(attributes) if attributes else None
     except ClientError as e:
-        print(f"[ERROR] update_expense failed: {e.response['Error']['Message']}")
+        logger.error("update_expense failed: %s", e.response["Error"]["Message"])
         return None
 
 
+# Value types the converters have to look inside; everything else passes through
+_TO_DYNAMO_TYPES = frozenset({float, dict, list})
+_FROM_DYNAMO_TYPES = frozenset({Decimal, dict, list})
+
+
+@lru_cache(maxsize=1024)
+def _float_to_decimal(value: float) -> Decimal:
+    """
+    Float -> Decimal via its shortest repr, memoized since amounts and
+    thresholds repeat. Integral floats skip the repr formatting entirely.
+    """
+    if value.is_integer():
+        return Decimal(int(value))
+    # Not Context.create_decimal_from_float: it converts the exact binary value,
+    # so 0.1 would be stored as 0.1000000000000000055511151231257827
+    return Decimal(str(value))
+
+
 def _convert_for_dynamo(obj: Any):
     """
     Recursively convert floats to Decimal for DynamoDB compatibility.
+    Dispatches on the exact type: values come from plain dicts/lists, and a
+    `type(...) is` check is cheaper than an isinstance chain on every leaf.
     """
-    if isinstance(obj, float):
-        return Decimal(str(obj))
-    if isinstance(obj, dict):
-        return {k: _convert_for_dynamo(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_convert_for_dynamo(v) for v in obj]
+    obj_type = type(obj)
+    if obj_type is float:
+        return _float_to_decimal(obj)
+    if obj_type is dict:
+        return {k: _convert_for_dynamo(v) if type(v) in _TO_DYNAMO_TYPES else v for k, v in obj.items()}
+    if obj_type is list:
+        return [_convert_for_dynamo(v) if type(v) in _TO_DYNAMO_TYPES else v for v in obj]
     return obj
 
 
@@ -151,87 +313,161 @@ def _from_dynamo(obj: Any):
     """
     Recursively convert Decimal instances back to native Python numeric types.
     """
-    if isinstance(obj, list):
-        return [_from_dynamo(item) for item in obj]
-    if isinstance(obj, dict):
-        return {k: _from_dynamo(v) for k, v in obj.items()}
-    if isinstance(obj, Decimal):
-        if obj % 1 == 0:
-            return int(obj)
-        return float(obj)
+    obj_type = type(obj)
+    if obj_type is Decimal:
+        # int() + compare is cheaper than Decimal modulo for the integral check
+        as_int = int(obj)
+        return as_int if as_int == obj else float(obj)
+    # Strings, bools and other leaves are copied inline instead of paying a
+    # function call each; only values that may need converting recurse.
+    if obj_type is dict:
+        return {k: _from_dynamo(v) if type(v) in _FROM_DYNAMO_TYPES else v for k, v in obj.items()}
+    if obj_type is list:
+        return [_from_dynamo(v) if type(v) in _FROM_DYNAMO_TYPES else v for v in obj]
     return obj
 
 
+def _from_dynamo_item(item: dict) -> dict:
+    """
+    Convert a top-level item freshly returned by boto3 in place. The response
+    dict is ours, so only the values that need converting are reassigned and
+    no copy of the item is built.
+    """
+    for key, value in item.items():
+        if type(value) in _FROM_DYNAMO_TYPES:
+            item[key] = _from_dynamo(value)
+    return item
+
+
 # Scheduler Settings Storage (per-user)
 SYSTEM_CONFIG_USER_ID = "SYSTEM_CONFIG"  # Still used for system-wide config if needed
 
 
+# Per-user settings reads are served from memory for a minute, then refreshed in
+# the background while the previous value keeps being served. Saves through this
+# module invalidate the entry so a user sees their own change immediately.
+# Cached dicts are shared between callers and must be treated as read-only.
+_scheduler_settings_cache = TTLCache(ttl=60, maxsize=10_000, stale_ttl=60)
+_budget_thresholds_cache = TTLCache(ttl=60, maxsize=10_000, stale_ttl=60)
+
+
 def get_scheduler_settings(user_id: str):
     """
     Get scheduler settings from DynamoDB for a specific user.
     Returns dict with day, hour, minute, enabled, or None if not found.
     """
+    return _scheduler_settings_cache.get_or_load(user_id, lambda: _fetch_scheduler_settings(user_id))
+
+
+def get_scheduler_settings_if_cached(user_id: str):
+    """Fresh cached scheduler settings, or None; never calls DynamoDB."""
+    return _scheduler_settings_cache.get(user_id)
+
+
+_SCHEDULER_PROJECTION = "scheduler_day, scheduler_hour, scheduler_minute, scheduler_enabled"
+
+
+def _scheduler_settings_from(attributes: dict) -> dict:
+    """Settings dict from the scheduler_* attributes of a user item or update response."""
+    return {
+        "day": int(attributes.get("scheduler_day", 1)),
+        "hour": int(attributes.get("scheduler_hour", 6)),
+        "minute": int(attributes.get("scheduler_minute", 0)),
+        "enabled": bool(attributes.get("scheduler_enabled", False)),
+    }
+
+
+def _fetch_scheduler_settings(user_id: str):
     try:
-        response = users_table.get_item(Key={"user_id": user_id})
+        # Only the four scheduler attributes come back (not budget_thresholds),
+        # so the numbers are converted directly instead of walking the item
+        response = _client().get_item(
+            TableName=get_settings().DYNAMO_USERS_TABLE,
+            Key={"user_id": user_id},
+            ProjectionExpression=_SCHEDULER_PROJECTION,
+            ConsistentRead=False,
+        )
         item = response.get("Item")
-        if item:
-            user_data = _from_dynamo(item)
-            return {
-                "day": user_data.get("scheduler_day", 1),
-                "hour": user_data.get("scheduler_hour", 6),
-                "minute": user_data.get("scheduler_minute", 0),
-                "enabled": user_data.get("scheduler_enabled", False),
-            }
-        return None
+        if item is None:
+            return None
+        return _scheduler_settings_from(item)
     except ClientError as e:
-        print(f"[ERROR] get_scheduler_settings failed: {e.response['Error']['Message']}")
+        logger.error("get_scheduler_settings failed: %s", e.response["Error"]["Message"])
         return None
 
 
-def save_scheduler_settings(user_id: str, day: int, hour: int, minute: int, enabled: Optional[bool] = None):
+def update_schedule_fields(user_id: str, day: int, hour: int, minute: int):
     """
-    Save scheduler settings to DynamoDB for a specific user.
+    Save a user's schedule (day/hour/minute) without touching the enabled flag.
+    The write returns the updated attributes, so the resulting settings come
+    back from the same UpdateItem instead of a separate read.
+    Returns the settings dict, or None if the user doesn't exist or the write failed.
     """
     try:
-        # Get existing user data to preserve other fields
-        existing_user = get_user_by_id(user_id)
-        
-        if existing_user:
-            # Update existing user record
-            item = dict(existing_user)
-            item["scheduler_day"] = day
-            item["scheduler_hour"] = hour
-            item["scheduler_minute"] = minute
-            if enabled is not None:
-                item["scheduler_enabled"] = enabled
-            elif "scheduler_enabled" not in item:
-                item["scheduler_enabled"] = False
-            item["updated_at"] = datetime.utcnow().isoformat()
-        else:
-            # User doesn't exist, this shouldn't happen but handle gracefully
-            raise ValueError(f"User {user_id} not found")
-        
-        users_table.put_item(Item=_convert_for_dynamo(item))
-        return True
+        response = users_table().update_item(
+            Key={"user_id": user_id},
+            UpdateExpression=(
+                "SET scheduler_day = :day, scheduler_hour = :hour, scheduler_minute = :minute, "
+                "scheduler_enabled = if_not_exists(scheduler_enabled, :enabled), updated_at = :updated_at"
+            ),
+            ConditionExpression="attribute_exists(user_id)",
+            ExpressionAttributeValues={
+                ":day": day,
+                ":hour": hour,
+                ":minute": minute,
+                ":enabled": False,
+                ":updated_at": utc_now_iso_seconds(),
+            },
+            ReturnValues="UPDATED_NEW",
+        )
     except ClientError as e:
-        print(f"[ERROR] save_scheduler_settings failed: {e.response['Error']['Message']}")
-        return False
-    except Exception as e:
-        print(f"[ERROR] save_scheduler_settings failed: {str(e)}")
-        return False
+        logger.error("update_schedule_fields failed: %s", e.response["Error"]["Message"])
+        return None
+    settings = _scheduler_settings_from(response["Attributes"])
+    _scheduler_settings_cache.set(user_id, settings)
+    return settings
 
 
-def initialize_default_scheduler_settings(user_id: str):
+def set_scheduler_enabled(user_id: str, enabled: bool):
     """
-    Initialize default scheduler settings in DynamoDB for a specific user if they don't exist.
-    Default: 1st day of month, 6 AM UTC, disabled.
+    Turn the scheduler on or off for a user in a single UpdateItem.
+    Users without a stored schedule get the defaults (1st day, 6 AM UTC) in the
+    same write, so callers don't need to read or initialise the settings first.
+    Returns True if the user exists and the flag was saved. The write is
+    idempotent, so start/stop retries simply repeat it.
     """
-    existing = get_scheduler_settings(user_id)
-    if existing is None:
-        # No settings exist, create default
-        save_scheduler_settings(user_id, day=1, hour=6, minute=0, enabled=False)
-        return True
-    return False
+    update_expression = (
+        "SET scheduler_day = if_not_exists(scheduler_day, :day), "
+        "scheduler_hour = if_not_exists(scheduler_hour, :hour), "
+        "scheduler_minute = if_not_exists(scheduler_minute, :minute), "
+        "scheduler_enabled = :enabled, updated_at = :updated_at"
+    )
+    values = {
+        ":day": 1,
+        ":hour": 6,
+        ":minute": 0,
+        ":enabled": enabled,
+        ":updated_at": utc_now_iso_seconds(),
+    }
+    if enabled:
+        update_expression += f", {SCHEDULER_ENABLED_INDEX_KEY} = :index_value"
+        values[":index_value"] = SCHEDULER_ENABLED_INDEX_VALUE
+    else:
+        update_expression += f" REMOVE {SCHEDULER_ENABLED_INDEX_KEY}"
+
+    try:
+        response = users_table().update_item(
+            Key={"user_id": user_id},
+            UpdateExpression=update_expression,
+            ConditionExpression="attribute_exists(user_id)",
+            ExpressionAttributeValues=values,
+            ReturnValues="UPDATED_NEW",
+        )
+    except ClientError as e:
+        logger.error("set_scheduler_enabled failed: %s", e.response["Error"]["Message"])
+        return False
+    _scheduler_settings_cache.set(user_id, _scheduler_settings_from(response["Attributes"]))
+    return True
 
 
 def get_all_users_with_scheduler_enabled():
@@ -240,24 +476,62 @@ def get_all_users_with_scheduler_enabled():
     Used by the scheduler to determine which users to process.
     """
     try:
-        # Scan users table for users with scheduler_enabled = True
-        # Note: This is a scan operation, which can be expensive for large tables
-        # In production, consider adding a GSI on scheduler_enabled
-        from boto3.dynamodb import conditions
-        response = users_table.scan(
-            FilterExpression=conditions.Attr("scheduler_enabled").eq(True)
+        # Query the sparse scheduler-enabled GSI: only enabled users are read
+        items = _query_all(
+            get_settings().DYNAMO_USERS_TABLE,
+            IndexName=SCHEDULER_ENABLED_INDEX,
+            KeyConditionExpression=f"{SCHEDULER_ENABLED_INDEX_KEY} = :enabled",
+            ExpressionAttributeValues={":enabled": SCHEDULER_ENABLED_INDEX_VALUE},
+            ProjectionExpression="user_id",
         )
         user_ids = []
-        for item in response.get("Items", []):
+        for item in items:
             user_id = item.get("user_id")
             if user_id and user_id != SYSTEM_CONFIG_USER_ID:
                 user_ids.append(user_id)
         return user_ids
     except ClientError as e:
-        print(f"[ERROR] get_all_users_with_scheduler_enabled failed: {e.response['Error']['Message']}")
+        logger.error("get_all_users_with_scheduler_enabled failed: %s", e.response["Error"]["Message"])
         return []
 
 
+def backfill_scheduler_enabled_index() -> int:
+    """
+    One-off migration for users enabled before the scheduler-enabled GSI existed:
+    sets SCHEDULER_ENABLED_INDEX_KEY on every user with scheduler_enabled = true
+    that lacks it, so the monthly job's index query picks them up again.
+    Safe to re-run. Returns the number of users updated.
+    """
+    table_name = get_settings().DYNAMO_USERS_TABLE
+    paginator = _client().get_paginator("scan")
+    pages = paginator.paginate(
+        TableName=table_name,
+        FilterExpression="scheduler_enabled = :true AND attribute_not_exists(#key)",
+        ExpressionAttributeNames={"#key": SCHEDULER_ENABLED_INDEX_KEY},
+        ExpressionAttributeValues={":true": True},
+        ProjectionExpression="user_id",
+    )
+    updated = 0
+    for page in pages:
+        for item in page["Items"]:
+            try:
+                _client().update_item(
+                    TableName=table_name,
+                    Key={"user_id": item["user_id"]},
+                    UpdateExpression="SET #key = :index_value",
+                    # Skip users who disabled the scheduler since the scan read them
+                    ConditionExpression="scheduler_enabled = :true",
+                    ExpressionAttributeNames={"#key": SCHEDULER_ENABLED_INDEX_KEY},
+                    ExpressionAttributeValues={":true": True, ":index_value": SCHEDULER_ENABLED_INDEX_VALUE},
+                )
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                    raise
+                continue
+            updated += 1
+    return updated
+
+
 def get_budget_thresholds(user_id: str):
     """
     Get budget thresholds from DynamoDB for a specific user.
@@ -265,86 +539,142 @@ def get_budget_thresholds(user_id: str):
     """
     # Validate user_id before making DynamoDB call
     if not user_id or not isinstance(user_id, str) or user_id.strip() == "":
-        print(f"[ERROR] get_budget_thresholds failed: Invalid user_id provided: {user_id}")
+        logger.error("get_budget_thresholds failed: Invalid user_id provided: %r", user_id)
         return None
-    
+
+    return _budget_thresholds_cache.get_or_load(user_id, lambda: _fetch_budget_thresholds(user_id))
+
+
+def get_budget_thresholds_if_cached(user_id: str):
+    """Fresh cached budget thresholds, or None; never calls DynamoDB."""
+    return _budget_thresholds_cache.get(user_id)
+
+
+def _fetch_budget_thresholds(user_id: str):
     try:
-        response = users_table.get_item(Key={"user_id": user_id})
-        item = response.get("Item")
-        if item:
-            user_data = _from_dynamo(item)
-            thresholds = user_data.get("budget_thresholds")
-            if thresholds:
-                return thresholds
+        # Eventually consistent (the default, half the RCUs) is enough: this
+        # process's own writes go straight into the cache. Only the thresholds
+        # map is fetched rather than the whole user item.
+        response = _client().get_item(
+            TableName=get_settings().DYNAMO_USERS_TABLE,
+            Key={"user_id": user_id},
+            ProjectionExpression="budget_thresholds",
+            ConsistentRead=False,
+        )
+        thresholds = response.get("Item", {}).get("budget_thresholds")
+        if thresholds:
+            return _from_dynamo(thresholds)
         return None
     except ClientError as e:
         error_msg = e.response.get('Error', {}).get('Message', str(e))
-        print(f"[ERROR] get_budget_thresholds failed for user_id '{user_id}': {error_msg}")
+        logger.error("get_budget_thresholds failed for user_id '%s': %s", user_id, error_msg)
         return None
     except Exception as e:
-        print(f"[ERROR] get_budget_thresholds failed for user_id '{user_id}': {str(e)}")
+        logger.error("get_budget_thresholds failed for user_id '%s': %s", user_id, e)
         return None
 
 
+_USER_SETTINGS_PROJECTION = _SCHEDULER_PROJECTION + ", budget_thresholds"
+
+
+def get_user_settings(user_id: str):
+    """
+    Scheduler settings and budget thresholds for a user, as a
+    (scheduler_settings, thresholds) tuple with None for whatever is missing.
+    Both live on the user item, so when either isn't cached they are fetched
+    together with one GetItem and both caches are filled.
+    """
+    scheduler_settings = _scheduler_settings_cache.get(user_id)
+    thresholds = _budget_thresholds_cache.get(user_id)
+    if scheduler_settings is not None and thresholds is not None:
+        return scheduler_settings, thresholds
+
+    try:
+        response = _client().get_item(
+            TableName=get_settings().DYNAMO_USERS_TABLE,
+            Key={"user_id": user_id},
+            ProjectionExpression=_USER_SETTINGS_PROJECTION,
+            ConsistentRead=False,
+        )
+    except ClientError as e:
+        logger.error("get_user_settings failed: %s", e.response["Error"]["Message"])
+        return scheduler_settings, thresholds
+
+    item = response.get("Item")
+    if item is None:
+        return None, None
+    scheduler_settings = _scheduler_settings_from(item)
+    _scheduler_settings_cache.set(user_id, scheduler_settings)
+    thresholds = _from_dynamo(item["budget_thresholds"]) if item.get("budget_thresholds") else None
+    if thresholds:
+        _budget_thresholds_cache.set(user_id, thresholds)
+    return scheduler_settings, thresholds
+
+
 def save_budget_thresholds(user_id: str, thresholds: dict):
     """
     Save budget thresholds to DynamoDB for a specific user.
     thresholds: dict with category names as keys and amounts as values.
+    Written with a single conditional UpdateItem; other user attributes are untouched.
     """
     try:
-        # Get existing user data to preserve other fields
-        existing_user = get_user_by_id(user_id)
-        
-        if existing_user:
-            # Update existing user record
-            item = dict(existing_user)
-            item["budget_thresholds"] = thresholds
-            item["updated_at"] = datetime.utcnow().isoformat()
+        stored = _convert_for_dynamo(thresholds)
+        users_table().update_item(
+            Key={"user_id": user_id},
+            UpdateExpression="SET budget_thresholds = :thresholds, updated_at = :updated_at",
+            ConditionExpression="attribute_exists(user_id)",
+            ExpressionAttributeValues={
+                ":thresholds": stored,
+                ":updated_at": utc_now_iso_seconds(),
+            },
+        )
+        # Write-through, converted back exactly as a read would return it. An
+        # empty mapping reads back as "not found", so it is dropped instead
+        if stored:
+            _budget_thresholds_cache.set(user_id, _from_dynamo(stored))
         else:
-            # User doesn't exist, this shouldn't happen but handle gracefully
-            raise ValueError(f"User {user_id} not found")
-        
-        users_table.put_item(Item=_convert_for_dynamo(item))
+            _budget_thresholds_cache.pop(user_id)
         return True
     except ClientError as e:
-        print(f"[ERROR] save_budget_thresholds failed: {e.response['Error']['Message']}")
+        logger.error("save_budget_thresholds failed: %s", e.response["Error"]["Message"])
         return False
     except Exception as e:
-        print(f"[ERROR] save_budget_thresholds failed: {str(e)}")
+        logger.error("save_budget_thresholds failed: %s", e)
         return False
 
 
-def initialize_default_budget_thresholds(user_id: str):
-    """
-    Initialize default budget thresholds in DynamoDB for a specific user if they don't exist.
-    Loads from config/budget_thresholds.json file.
-    """
-    existing = get_budget_thresholds(user_id)
-    if existing is None:
-        # Load from JSON file
-        import json
-        from pathlib import Path
-        from app.core.config import settings
-        
-        budget_file = Path(settings.BUDGET_THRESHOLDS_JSON)
-        if budget_file.exists():
-            with budget_file.open() as fp:
-                thresholds = json.load(fp)
-                save_budget_thresholds(user_id, thresholds)
-                return True
-        else:
-            # Use default thresholds if file doesn't exist
-            default_thresholds = {
-                "Food": 400,
-                "Travel": 250,
-                "Rent": 1200,
-                "Shopping": 300,
-                "Utilities": 180,
-                "Health": 150,
-                "Entertainment": 150,
-                "Education": 200,
-                "Misc": 100
-            }
-            save_budget_thresholds(user_id, default_thresholds)
-            return True
-    return False
\ No newline at end of file
+@lru_cache(maxsize=1)
+def _default_budget_thresholds() -> dict:
+    """
+    Default thresholds from config/budget_thresholds.json, parsed once per process.
+    Falls back to built-in values if the file doesn't exist.
+    """
+    budget_file = Path(get_settings().BUDGET_THRESHOLDS_JSON)
+    if budget_file.exists():
+        return orjson.loads(budget_file.read_bytes())
+    return {
+        "Food": 400,
+        "Travel": 250,
+        "Rent": 1200,
+        "Shopping": 300,
+        "Utilities": 180,
+        "Health": 150,
+        "Entertainment": 150,
+        "Education": 200,
+        "Misc": 100
+    }
+
+
+def default_user_settings() -> dict:
+    """
+    Default budget thresholds and scheduler settings for a new user, meant to be
+    merged into the item passed to put_user so registration is a single write.
+    """
+    return {
+        "budget_thresholds": _default_budget_thresholds(),
+        "scheduler_day": 1,
+        "scheduler_hour": 6,
+        "scheduler_minute": 0,
+        "scheduler_enabled": False,
+        "updated_at": utc_now_iso_seconds(),
+    }
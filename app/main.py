@@ -1,9 +1,15 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 import logging
+import threading
 
-from app.core.config import settings
+from anyio import to_thread
+
+from app.core.config import get_jwt_secret, settings
+from app.core.logging_config import start_log_listener, stop_log_listener
+from app.db import dynamo
 from app.routers import auth, expenses, reports, lambda_trigger, health, notifications, settings as settings_router
 from app.utils.scheduler import start_scheduler, stop_scheduler
 
@@ -12,6 +18,15 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    log_listener = start_log_listener()
+    # Resolve the JWT key (possibly a Secrets Manager call) before serving, so a
+    # bad secret fails startup and request auth never blocks the event loop on it
+    get_jwt_secret()
+    # Sync endpoints run on AnyIO worker threads (40 by default); let as many
+    # requests wait on DynamoDB at once as the shared connection pool can serve
+    to_thread.current_default_thread_limiter().total_tokens = dynamo.DYNAMO_MAX_POOL_CONNECTIONS
+    # Warm the DynamoDB client in the background so startup isn't blocked on AWS
+    threading.Thread(target=dynamo.warm_up, name="dynamo-warm-up", daemon=True).start()
     # Startup: Start the scheduler
     logger.info("Starting scheduler...")
     start_scheduler()
@@ -19,12 +34,15 @@ async def lifespan(app: FastAPI):
     # Shutdown: Stop the scheduler
     logger.info("Stopping scheduler...")
     stop_scheduler()
+    stop_log_listener(log_listener)
 
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     debug=settings.DEBUG,
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes the large expense/summary payloads much faster than stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 # CORS configuration
@@ -1,14 +1,42 @@
-from pydantic import BaseModel, Field
+from decimal import ROUND_HALF_UP, Decimal
+from pydantic import BaseModel, Field, validator
 from typing import Optional
 from uuid import uuid4
 from datetime import datetime
 
 
+def _utc_now_iso() -> str:
+    return datetime.utcnow().isoformat()
+
+
+def new_expense_id(timestamp: Optional[str] = None) -> str:
+    """
+    Sort key for a new expense: ISO timestamp plus a short random suffix, so two
+    expenses stamped with the same instant don't overwrite each other while
+    begins_with("YYYY-MM") still selects the month. "_" keeps the id URL-safe.
+    """
+    return f"{timestamp or _utc_now_iso()}_{uuid4().hex[:8]}"
+
+
+_CENT = Decimal("0.01")
+
+
+def _round_to_cents(amount: Optional[float]) -> Optional[float]:
+    # Amounts are stored as exact cents so float noise never reaches DynamoDB.
+    # Rounds the decimal repr half-up, like _float_to_decimal in dynamo.py;
+    # round() works on the binary value, so 1.005 would become 1.0
+    if amount is None:
+        return None
+    return float(Decimal(str(amount)).quantize(_CENT, rounding=ROUND_HALF_UP))
+
+
 class ExpenseCreate(BaseModel):
     category: str
     amount: float
     description: Optional[str] = ""
-    timestamp: Optional[str] = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: Optional[str] = Field(default_factory=_utc_now_iso)
+
+    _amount_to_cents = validator("amount", allow_reuse=True)(_round_to_cents)
 
 
 class ExpenseUpdate(BaseModel):
@@ -17,14 +45,18 @@ class ExpenseUpdate(BaseModel):
     description: Optional[str]
     timestamp: Optional[str]
 
+    _amount_to_cents = validator("amount", allow_reuse=True)(_round_to_cents)
+
 
 class ExpenseInDB(BaseModel):
     user_id: str
-    expense_id: str = Field(default_factory=lambda: datetime.utcnow().isoformat())  # ISO timestamp SK
+    expense_id: str = Field(default_factory=new_expense_id)  # ISO timestamp + suffix SK
     category: str
     amount: float
     description: Optional[str] = ""
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=_utc_now_iso)
+
+    _amount_to_cents = validator("amount", allow_reuse=True)(_round_to_cents)
 
 
 class ExpensePublic(BaseModel):
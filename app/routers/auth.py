@@ -1,24 +1,14 @@
-from fastapi import APIRouter, HTTPException, status, Depends, Header
-from typing import Optional
+import logging
+
+from fastapi import APIRouter, HTTPException, status, Depends
 from app.models.user import UserCreate, UserLogin, UserInDB, UserPublic
-from app.core.security import get_password_hash, verify_password, create_access_token, decode_access_token
+from app.core.deps import get_current_user_id
+from app.core.security import get_password_hash, verify_password, create_access_token
 from app.db import dynamo
 from uuid import uuid4
 
 router = APIRouter()
-
-
-def get_current_user_id(authorization: Optional[str] = Header(None)) -> str:
-    """Extract user_id from JWT token"""
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token required")
-    
-    token = authorization.replace("Bearer ", "")
-    payload = decode_access_token(token)
-    user_id = payload.get("sub")
-    if not user_id:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-    return user_id
+logger = logging.getLogger(__name__)
 
 
 @router.post("/register", response_model=UserPublic)
@@ -34,17 +24,19 @@ def register(user: UserCreate):
         password_hash=get_password_hash(user.password)
     )
 
-    success = dynamo.put_user(user_db.dict())
+    # Default budget thresholds and scheduler settings are stored with the user
+    # item itself, so registration is one write instead of three
+    user_item = user_db.dict()
+    success = dynamo.put_user({**user_item, **dynamo.default_user_settings()})
     if not success:
         raise HTTPException(status_code=500, detail="Error saving user")
 
-    # Initialize default budget thresholds for this new user
-    dynamo.initialize_default_budget_thresholds(user_db.user_id)
-    
-    # Initialize default scheduler settings for this new user
-    dynamo.initialize_default_scheduler_settings(user_db.user_id)
-
-    return UserPublic(**user_db.dict())
+    return UserPublic(
+        user_id=user_item["user_id"],
+        email=user_item["email"],
+        created_at=user_item["created_at"],
+        profile_image_url=user_item["profile_image_url"],
+    )
 
 
 @router.get("/me", response_model=UserPublic)
@@ -65,23 +57,20 @@ def get_current_user(user_id: str = Depends(get_current_user_id)):
 @router.post("/login")
 def login(login_data: UserLogin):
     # Accept JSON body with email and password
-    import logging
-    logger = logging.getLogger(__name__)
-    
     try:
-        logger.info(f"Login attempt for email: {login_data.email}")
+        logger.info("Login attempt for email: %s", login_data.email)
         user = dynamo.get_user_by_email(login_data.email)
         
         if not user:
-            logger.warning(f"User not found: {login_data.email}")
+            logger.warning("User not found: %s", login_data.email)
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
         
         if not verify_password(login_data.password, user["password_hash"]):
-            logger.warning(f"Invalid password for user: {login_data.email}")
+            logger.warning("Invalid password for user: %s", login_data.email)
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
         access_token = create_access_token(data={"sub": user["user_id"]})
-        logger.info(f"Login successful for user: {login_data.email}")
+        logger.info("Login successful for user: %s", login_data.email)
         
         # Return token and user info
         user_public = UserPublic(
@@ -98,5 +87,5 @@ def login(login_data: UserLogin):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Login error: {str(e)}")
+        logger.error("Login error: %s", e)
         raise HTTPException(status_code=500, detail=f"Login failed: {str(e)}")
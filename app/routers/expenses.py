@@ -1,39 +1,35 @@
-from typing import Dict, List, Optional
+from typing import Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException, status, Header
+from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
-from app.core.config import settings
-from app.core.security import decode_access_token
+from app.core.deps import get_current_user_id, get_finance_analyzer
 from app.db import dynamo
-from app.models.expense import ExpenseCreate, ExpenseInDB, ExpensePublic, ExpenseUpdate
-from app.utils.analyzer import FinanceAnalyzer
+from app.models.expense import ExpenseCreate, ExpenseInDB, ExpensePublic, ExpenseUpdate, new_expense_id
 
 router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
-finance_analyzer = FinanceAnalyzer(settings.BUDGET_THRESHOLDS_JSON)
-
-
-def get_current_user_id(authorization: Optional[str] = Header(None)) -> str:
-    # JWT token authentication
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token required")
-    
-    token = authorization.replace("Bearer ", "")
-    payload = decode_access_token(token)
-    user_id = payload.get("sub")
-    if not user_id:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-    return user_id
 
 
 @router.post("/", response_model=ExpensePublic, status_code=status.HTTP_201_CREATED)
 def create_expense(expense: ExpenseCreate, user_id: str = Depends(get_current_user_id)):
-    expense_db = ExpenseInDB(user_id=user_id, **expense.dict())
-    success = dynamo.put_expense(expense_db.dict())
+    expense_data = expense.dict()
+    if "timestamp" not in expense.__fields_set__:
+        # Server-stamped expense: build the sort key from the same timestamp so
+        # both fields hold the same instant instead of two separate clock reads
+        expense_data["expense_id"] = new_expense_id(expense_data["timestamp"])
+    expense_db = ExpenseInDB(user_id=user_id, **expense_data)
+    expense_item = expense_db.dict()
+    success = dynamo.put_expense(expense_item)
     if not success:
         raise HTTPException(status_code=500, detail="Failed to save expense")
-    return ExpensePublic(**expense_db.dict())
+    return ExpensePublic(
+        expense_id=expense_item["expense_id"],
+        category=expense_item["category"],
+        amount=expense_item["amount"],
+        description=expense_item["description"],
+        timestamp=expense_item["timestamp"],
+    )
 
 
 @router.get("/monthly/{month}")
@@ -42,7 +38,7 @@ def list_monthly_expenses(month: str, user_id: str = Depends(get_current_user_id
     month must follow YYYY-MM format. Example: 2025-11
     """
     expenses = dynamo.get_expenses_for_user(user_id, month)
-    summary = finance_analyzer.summarize(expenses)
+    summary = get_finance_analyzer().summarize(expenses)
 
     return {
         "expenses": expenses,
@@ -2,19 +2,31 @@
 Health Check Router
 Simple health check endpoint
 """
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import APIRouter
-from datetime import datetime
 import logging
-import boto3
 from botocore.exceptions import ClientError
 
-from app.core.config import settings
+from app.core.config import get_settings
 from app.db import dynamo
-from app.utils.lambda_scheduler import lambda_client, LAMBDA_FUNCTION_NAME
+from app.utils.lambda_scheduler import get_function_cached, LAMBDA_FUNCTION_NAME
+# Reuse the report uploader's S3 client instead of building one per probe
+from app.utils.pdf_report import s3_client
+from app.utils.timestamps import utc_now_iso_seconds
+from app.utils.ttl_cache import TTLCache
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Dedicated pool for the blocking AWS probes so /status neither blocks the event
+# loop nor competes with request handlers for AnyIO's worker threads
+_PROBE_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="status-probe")
+
+# Probe results are reused for 20 seconds so liveness checks and dashboard polls
+# don't turn into a stream of AWS calls
+_probe_cache = TTLCache(ttl=20, maxsize=8)
+
 
 @router.get("/health")
 async def health_check():
@@ -22,81 +34,49 @@ async def health_check():
     Health check endpoint.
     Returns API status.
     """
+    # Load balancers poll this several times a second; the timestamp is only
+    # formatted once per second
     return {
         "status": "healthy",
-        "service": settings.PROJECT_NAME,
-        "timestamp": datetime.utcnow().isoformat()
+        "service": get_settings().PROJECT_NAME,
+        "timestamp": utc_now_iso_seconds()
     }
 
 
-@router.get("/status")
-async def aws_services_status():
-    """
-    Check connectivity and status of all AWS services:
-    - DynamoDB (Users and Expenses tables)
-    - S3 (Reports bucket)
-    - Lambda (Monthly reports function)
-    """
-    status = {
-        "timestamp": datetime.utcnow().isoformat(),
-        "services": {}
-    }
-    
-    # Check DynamoDB
-    dynamodb_status = {
-        "connected": False,
-        "tables": {},
-        "error": None
-    }
+def _check_table(table_name: str) -> dict:
     try:
-        # Check Users table
-        try:
-            dynamo.users_table.scan(Limit=1)
-            dynamodb_status["tables"]["users"] = {
-                "name": settings.DYNAMO_USERS_TABLE,
-                "status": "accessible",
-                "region": settings.DYNAMO_REGION
-            }
-        except Exception as e:
-            dynamodb_status["tables"]["users"] = {
-                "name": settings.DYNAMO_USERS_TABLE,
-                "status": "error",
-                "error": str(e)
-            }
-        
-        # Check Expenses table
-        try:
-            dynamo.expenses_table.scan(Limit=1)
-            dynamodb_status["tables"]["expenses"] = {
-                "name": settings.DYNAMO_EXPENSES_TABLE,
-                "status": "accessible",
-                "region": settings.DYNAMO_REGION
-            }
-        except Exception as e:
-            dynamodb_status["tables"]["expenses"] = {
-                "name": settings.DYNAMO_EXPENSES_TABLE,
-                "status": "error",
-                "error": str(e)
-            }
-        
-        if all(table["status"] == "accessible" for table in dynamodb_status["tables"].values()):
-            dynamodb_status["connected"] = True
+        # DescribeTable proves access without consuming read capacity like a Scan
+        dynamo.table_status(table_name)
+        return {
+            "name": table_name,
+            "status": "accessible",
+            "region": get_settings().DYNAMO_REGION
+        }
     except Exception as e:
-        dynamodb_status["error"] = str(e)
-        logger.error(f"DynamoDB check failed: {str(e)}")
-    
-    status["services"]["dynamodb"] = dynamodb_status
-    
-    # Check S3
+        return {
+            "name": table_name,
+            "status": "error",
+            "error": str(e)
+        }
+
+
+def _check_users_table() -> dict:
+    return _check_table(get_settings().DYNAMO_USERS_TABLE)
+
+
+def _check_expenses_table() -> dict:
+    return _check_table(get_settings().DYNAMO_EXPENSES_TABLE)
+
+
+def _check_s3() -> dict:
     s3_status = {
         "connected": False,
-        "bucket": settings.S3_BUCKET_NAME,
-        "region": settings.S3_REGION,
+        "bucket": get_settings().S3_BUCKET_NAME,
+        "region": get_settings().S3_REGION,
         "error": None
     }
     try:
-        s3_client = boto3.client("s3", region_name=settings.S3_REGION)
-        s3_client.head_bucket(Bucket=settings.S3_BUCKET_NAME)
+        s3_client().head_bucket(Bucket=get_settings().S3_BUCKET_NAME)
         s3_status["connected"] = True
         s3_status["status"] = "accessible"
     except ClientError as e:
@@ -108,24 +88,24 @@ async def aws_services_status():
         s3_status["error"] = str(e)
         s3_status["status"] = "error"
         logger.error(f"S3 check failed: {str(e)}")
-    
-    status["services"]["s3"] = s3_status
-    
-    # Check Lambda
+    return s3_status
+
+
+def _check_lambda() -> dict:
     lambda_status = {
         "connected": False,
         "function_name": LAMBDA_FUNCTION_NAME,
         "error": None
     }
     try:
-        response = lambda_client.get_function(FunctionName=LAMBDA_FUNCTION_NAME)
+        response = get_function_cached()
         lambda_status["connected"] = True
         lambda_status["status"] = response["Configuration"]["State"]
         lambda_status["runtime"] = response["Configuration"]["Runtime"]
         # LastModified is already a string from AWS API
         last_modified = response["Configuration"]["LastModified"]
         lambda_status["last_modified"] = last_modified.isoformat() if hasattr(last_modified, 'isoformat') else str(last_modified)
-        lambda_status["region"] = settings.DYNAMO_REGION
+        lambda_status["region"] = get_settings().DYNAMO_REGION
     except ClientError as e:
         error_code = e.response.get('Error', {}).get('Code', 'Unknown')
         lambda_status["error"] = f"{error_code}: {str(e)}"
@@ -135,9 +115,58 @@ async def aws_services_status():
         lambda_status["error"] = str(e)
         lambda_status["status"] = "error"
         logger.error(f"Lambda check failed: {str(e)}")
-    
+    return lambda_status
+
+
+def _cached_probe(probe) -> dict:
+    return _probe_cache.get_or_load(probe.__name__, probe)
+
+
+async def _run_probe(loop, probe) -> dict:
+    # A fresh cached result is returned straight from the event loop; only
+    # misses are dispatched to the probe pool
+    cached = _probe_cache.get(probe.__name__)
+    if cached is not None:
+        return cached
+    return await loop.run_in_executor(_PROBE_EXECUTOR, _cached_probe, probe)
+
+
+@router.get("/status")
+async def aws_services_status():
+    """
+    Check connectivity and status of all AWS services:
+    - DynamoDB (Users and Expenses tables)
+    - S3 (Reports bucket)
+    - Lambda (Monthly reports function)
+    All probes run concurrently, so the endpoint takes as long as the slowest one;
+    results are cached for 20 seconds.
+    """
+    status = {
+        "timestamp": utc_now_iso_seconds(),
+        "services": {}
+    }
+
+    loop = asyncio.get_running_loop()
+    users, expenses, s3_status, lambda_status = await asyncio.gather(
+        *(
+            _run_probe(loop, probe)
+            for probe in (_check_users_table, _check_expenses_table, _check_s3, _check_lambda)
+        )
+    )
+
+    # Check DynamoDB
+    dynamodb_status = {
+        "connected": False,
+        "tables": {"users": users, "expenses": expenses},
+        "error": None
+    }
+    if all(table["status"] == "accessible" for table in dynamodb_status["tables"].values()):
+        dynamodb_status["connected"] = True
+
+    status["services"]["dynamodb"] = dynamodb_status
+    status["services"]["s3"] = s3_status
     status["services"]["lambda"] = lambda_status
-    
+
     # Overall status
     all_connected = all(
         service.get("connected", False) 
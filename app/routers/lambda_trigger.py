@@ -2,16 +2,25 @@
 Lambda Trigger Router
 Endpoints for manually triggering the monthly expense reports Lambda function
 """
-from fastapi import APIRouter, HTTPException, Depends
+import json
+import logging
+
+from anyio import to_thread
+from fastapi import APIRouter, HTTPException, Depends, Response, status
 from pydantic import BaseModel
 from typing import Optional, Dict
 
-from app.utils.lambda_scheduler import trigger_monthly_reports
+from app.utils.lambda_scheduler import (
+    LAMBDA_FUNCTION_NAME,
+    get_function_cached,
+    get_function_if_cached,
+    trigger_monthly_reports,
+)
 from app.utils.scheduler import get_scheduler_status
-from app.core.security import decode_access_token
-from fastapi import Header
+from app.core.deps import get_current_user_id
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 class LambdaTriggerResponse(BaseModel):
@@ -22,40 +31,21 @@ class LambdaTriggerResponse(BaseModel):
     message: Optional[str] = None
 
 
-def get_current_user_id(authorization: Optional[str] = Header(None)) -> str:
-    """Extract and validate user ID from Authorization header"""
-    if not authorization:
-        raise HTTPException(status_code=401, detail="Authorization header missing")
-    
-    try:
-        # Extract token from "Bearer <token>"
-        token = authorization.replace("Bearer ", "").strip()
-        payload = decode_access_token(token)
-        user_id = payload.get("sub")
-        if not user_id:
-            raise HTTPException(status_code=401, detail="Invalid token: missing user ID")
-        return user_id
-    except Exception as e:
-        raise HTTPException(status_code=401, detail=f"Invalid token: {str(e)}")
-
-
 @router.post("/trigger", response_model=LambdaTriggerResponse)
-async def trigger_lambda_manually(user_id: str = Depends(get_current_user_id)) -> Dict:
+async def trigger_lambda_manually(
+    response: Response,
+    wait: bool = True,
+    user_id: str = Depends(get_current_user_id),
+) -> Dict:
     """
     Manually trigger the monthly expense reports Lambda function.
     This will send emails to all users with scheduler enabled.
+    Pass wait=false to queue the run and get a 202 back without waiting for it.
     """
     try:
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        # Check how many users have scheduler enabled
-        from app.db import dynamo
-        enabled_users = dynamo.get_all_users_with_scheduler_enabled()
-        logger.info(f"Found {len(enabled_users)} users with scheduler enabled: {enabled_users}")
-        
-        # Use trigger_monthly_reports() which gets enabled users and sends to Lambda
-        result = trigger_monthly_reports()
+        # Lambda finds the enabled users itself. The boto3 call blocks, so it runs
+        # on a worker thread instead of stalling the event loop
+        result = await to_thread.run_sync(lambda: trigger_monthly_reports(wait=wait))
         
         if not result.get("success"):
             raise HTTPException(
@@ -63,10 +53,17 @@ async def trigger_lambda_manually(user_id: str = Depends(get_current_user_id)) -
                 detail=result.get("error", "Failed to invoke Lambda function")
             )
         
+        if not wait:
+            response.status_code = status.HTTP_202_ACCEPTED
+            return LambdaTriggerResponse(
+                success=True,
+                message="Monthly reports queued. Emails will arrive shortly.",
+                status_code=result.get("status_code"),
+            )
+
         # Parse the result to get a better message
         message = result.get("message", "Monthly reports triggered successfully")
         if result.get("result"):
-            import json
             try:
                 lambda_result = json.loads(result.get("result"))
                 if isinstance(lambda_result, dict) and "body" in lambda_result:
@@ -79,7 +76,8 @@ async def trigger_lambda_manually(user_id: str = Depends(get_current_user_id)) -
                             message = f"No users found with scheduler enabled. Please make sure you have clicked 'Start' in the scheduler settings and have expenses for the current month."
                         else:
                             message = f"Successfully processed {users_processed} user(s). Check your email!"
-            except:
+            except (ValueError, TypeError, AttributeError):
+                # Payload isn't the expected JSON shape; keep the default message
                 pass
         
         return LambdaTriggerResponse(
@@ -91,8 +89,6 @@ async def trigger_lambda_manually(user_id: str = Depends(get_current_user_id)) -
     except HTTPException:
         raise
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Error triggering Lambda: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error triggering Lambda: {str(e)}")
 
@@ -103,10 +99,8 @@ async def lambda_status():
     Check if Lambda function is accessible and scheduler status.
     """
     try:
-        import boto3
-        from app.utils.lambda_scheduler import lambda_client, LAMBDA_FUNCTION_NAME
-        
-        response = lambda_client.get_function(FunctionName=LAMBDA_FUNCTION_NAME)
+        # Cache hits are answered on the event loop; only a miss hops to a thread
+        response = get_function_if_cached() or await to_thread.run_sync(get_function_cached)
         scheduler_status = get_scheduler_status()
         
         return {
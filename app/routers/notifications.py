@@ -2,40 +2,53 @@
 Notifications Router
 Provides threshold-based notifications for budget overspending, spending spikes, and warnings
 """
-from typing import Dict, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Header
+import time
+from collections import Counter
+from typing import Dict, List
+from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 
-from app.core.config import settings
-from app.core.security import decode_access_token
+from app.core.deps import get_current_user_id, get_finance_analyzer
 from app.db import dynamo
-from app.utils.analyzer import FinanceAnalyzer
 
 router = APIRouter()
-finance_analyzer = FinanceAnalyzer(settings.BUDGET_THRESHOLDS_JSON)
+# Notifications never show descriptions, so they aren't fetched
+_NOTIFICATION_ATTRIBUTES = ("expense_id", "category", "amount", "timestamp")
 
-
-def get_current_user_id(authorization: Optional[str] = Header(None)) -> str:
-    """Extract user_id from JWT token"""
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token required")
-    
-    token = authorization.replace("Bearer ", "")
-    payload = decode_access_token(token)
-    user_id = payload.get("sub")
-    if not user_id:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-    return user_id
+# Message templates, parsed once at import instead of per notification
+_MSG_BUDGET_EXCEEDED = (
+    "You've exceeded your {category} budget by €{over:.2f} ({pct:.1f}% over limit). "
+    "Budget: €{threshold:.2f}, Spent: €{spent:.2f}"
+).format
+_MSG_APPROACHING = (
+    "You've used {pct:.1f}% of your {category} budget. "
+    "Only €{remaining:.2f} remaining out of €{threshold:.2f}."
+).format
+_MSG_SPIKE = (
+    "Large expense detected: €{amount:.2f} in {category} category on {timestamp}. "
+    "This is significantly higher than your average spending."
+).format
+_MSG_SPIKES = (
+    "You have {count} unusual expenses this month totaling €{total:.2f}. "
+    "Review your spending patterns."
+).format
+_MSG_HIGH_MONTHLY = (
+    "Your total spending this month is €{total:.2f}, which is {pct:.1f}% of your "
+    "combined budget limits. Consider reviewing your expenses."
+).format
+_MSG_GOOD_PROGRESS = (
+    "You're doing well! All categories are under 70% of their budget limits. "
+    "Keep up the good work!"
+)
 
 
-def generate_notifications(expenses: List[Dict], summary: Dict, month: str, user_id: str) -> List[Dict]:
+def generate_notifications(expenses: List[Dict], summary: Dict, month: str, thresholds: Dict[str, float]) -> List[Dict]:
     """
     Generate user-friendly notifications based on spending patterns and thresholds.
     Returns list of notification objects with type, message, and severity.
-    Uses thresholds from DynamoDB for the specific user (loaded via finance_analyzer).
+    `thresholds` are the user's budget thresholds, already loaded by the caller.
     """
     notifications = []
-    # Load thresholds from DB for this user (analyzer loads from DB first, then falls back to file)
-    thresholds = finance_analyzer.load_thresholds(user_id=user_id)
     
     if not expenses:
         return notifications
@@ -57,34 +70,45 @@ def generate_notifications(expenses: List[Dict], summary: Dict, month: str, user
             "type": "budget_exceeded",
             "severity": "danger",
             "title": f"Budget Exceeded: {category}",
-            "message": f"You've exceeded your {category} budget by €{over_amount:.2f} ({percentage_over:.1f}% over limit). Budget: €{threshold:.2f}, Spent: €{spent_amount:.2f}",
+            "message": _MSG_BUDGET_EXCEEDED(
+                category=category, over=over_amount, pct=percentage_over, threshold=threshold, spent=spent_amount
+            ),
             "category": category,
             "amount": spent_amount,
             "threshold": threshold,
             "over_amount": over_amount,
         })
     
-    # 2. Approaching Budget Threshold (Warning - 80% of budget)
+    # One pass over the thresholds builds the approaching-budget warnings and
+    # collects what sections 4 and 5 need (combined budget, all under 70%)
+    total_threshold = 0
+    all_categories_under_70 = True
     for category, threshold in thresholds.items():
+        total_threshold += threshold
+        if threshold <= 0:
+            continue
+
+        spent = category_totals.get(category, 0)
+        percentage = (spent / threshold) * 100
+        if percentage >= 70:
+            all_categories_under_70 = False
+
+        # 2. Approaching Budget Threshold (Warning - 80% of budget)
         if category in overspending:
             continue  # Skip if already exceeded
-        
-        spent = category_totals.get(category, 0)
-        if spent > 0:
-            percentage = (spent / threshold) * 100 if threshold > 0 else 0
-            if percentage >= 80 and percentage < 100:
-                remaining = threshold - spent
-                notifications.append({
-                    "id": f"approaching_{category}_{month}",
-                    "type": "approaching_budget",
-                    "severity": "warning",
-                    "title": f"Approaching Budget Limit: {category}",
-                    "message": f"You've used {percentage:.1f}% of your {category} budget. Only €{remaining:.2f} remaining out of €{threshold:.2f}.",
-                    "category": category,
-                    "amount": spent,
-                    "threshold": threshold,
-                    "percentage": percentage,
-                })
+        if spent > 0 and percentage >= 80 and percentage < 100:
+            remaining = threshold - spent
+            notifications.append({
+                "id": f"approaching_{category}_{month}",
+                "type": "approaching_budget",
+                "severity": "warning",
+                "title": f"Approaching Budget Limit: {category}",
+                "message": _MSG_APPROACHING(pct=percentage, category=category, remaining=remaining, threshold=threshold),
+                "category": category,
+                "amount": spent,
+                "threshold": threshold,
+                "percentage": percentage,
+            })
     
     # 3. Spending Spike Notifications (Warning)
     if spending_spikes:
@@ -98,7 +122,11 @@ def generate_notifications(expenses: List[Dict], summary: Dict, month: str, user
                 "type": "spending_spike",
                 "severity": "warning",
                 "title": "Unusual Spending Detected",
-                "message": f"Large expense detected: €{spike.get('amount', 0):.2f} in {spike.get('category', 'Unknown')} category on {spike.get('timestamp', 'unknown date')}. This is significantly higher than your average spending.",
+                "message": _MSG_SPIKE(
+                    amount=spike.get("amount", 0),
+                    category=spike.get("category", "Unknown"),
+                    timestamp=spike.get("timestamp", "unknown date"),
+                ),
                 "category": spike.get("category"),
                 "amount": spike.get("amount"),
             })
@@ -108,13 +136,12 @@ def generate_notifications(expenses: List[Dict], summary: Dict, month: str, user
                 "type": "spending_spikes",
                 "severity": "warning",
                 "title": "Multiple Unusual Expenses Detected",
-                "message": f"You have {spike_count} unusual expenses this month totaling €{total_spike_amount:.2f}. Review your spending patterns.",
+                "message": _MSG_SPIKES(count=spike_count, total=total_spike_amount),
                 "count": spike_count,
                 "total_amount": total_spike_amount,
             })
     
     # 4. High Monthly Total Warning (Info)
-    total_threshold = sum(thresholds.values()) if thresholds else 0
     if total_threshold > 0 and monthly_total > 0:
         monthly_percentage = (monthly_total / total_threshold) * 100
         if monthly_percentage >= 90:
@@ -123,49 +150,42 @@ def generate_notifications(expenses: List[Dict], summary: Dict, month: str, user
                 "type": "high_monthly_total",
                 "severity": "info",
                 "title": "High Monthly Spending",
-                "message": f"Your total spending this month is €{monthly_total:.2f}, which is {monthly_percentage:.1f}% of your combined budget limits. Consider reviewing your expenses.",
+                "message": _MSG_HIGH_MONTHLY(total=monthly_total, pct=monthly_percentage),
                 "total": monthly_total,
                 "percentage": monthly_percentage,
             })
     
     # 5. Good Progress Notification (Success - if spending is reasonable)
     if not overspending and monthly_total > 0:
-        all_categories_under_70 = all(
-            (category_totals.get(cat, 0) / thresholds.get(cat, 1)) * 100 < 70
-            for cat in thresholds.keys()
-            if thresholds.get(cat, 0) > 0
-        )
         if all_categories_under_70 and len(category_totals) > 0:
             notifications.append({
                 "id": f"good_progress_{month}",
                 "type": "good_progress",
                 "severity": "success",
                 "title": "Great Budget Management!",
-                "message": f"You're doing well! All categories are under 70% of their budget limits. Keep up the good work!",
+                "message": _MSG_GOOD_PROGRESS,
             })
     
     return notifications
 
 
-@router.get("/{month}")
-def get_notifications(month: str, user_id: str = Depends(get_current_user_id)) -> Dict:
-    """
-    Get notifications for a specific month based on spending patterns and thresholds.
-    month must follow YYYY-MM format. Example: 2025-11
-    """
-    expenses = dynamo.get_expenses_for_user(user_id, month)
+def _build_notifications(month: str, user_id: str) -> Dict:
+    """Notifications payload for `user_id` in `month`; shared by both routes."""
+    expenses = dynamo.get_expenses_for_user(user_id, month, _NOTIFICATION_ATTRIBUTES)
     # Load user's thresholds for analysis
+    finance_analyzer = get_finance_analyzer()
     thresholds = finance_analyzer.load_thresholds(user_id=user_id)
     summary = finance_analyzer.summarize(expenses, budget_overrides=thresholds)
     
-    notifications = generate_notifications(expenses, summary, month, user_id)
+    notifications = generate_notifications(expenses, summary, month, thresholds)
     
-    # Count by severity
+    # Count by severity in a single pass
+    counts = Counter(n["severity"] for n in notifications)
     severity_counts = {
-        "danger": len([n for n in notifications if n["severity"] == "danger"]),
-        "warning": len([n for n in notifications if n["severity"] == "warning"]),
-        "info": len([n for n in notifications if n["severity"] == "info"]),
-        "success": len([n for n in notifications if n["severity"] == "success"]),
+        "danger": counts["danger"],
+        "warning": counts["warning"],
+        "info": counts["info"],
+        "success": counts["success"],
     }
     
     return {
@@ -176,12 +196,21 @@ def get_notifications(month: str, user_id: str = Depends(get_current_user_id)) -
     }
 
 
-@router.get("/")
-def get_current_month_notifications(user_id: str = Depends(get_current_user_id)) -> Dict:
+# The routes return ORJSONResponse themselves: the payload is already plain
+# JSON types, so FastAPI's response-model validation and jsonable_encoder walk
+# over every notification would be wasted work
+@router.get("/{month}", response_class=ORJSONResponse)
+def get_notifications(month: str, user_id: str = Depends(get_current_user_id)) -> ORJSONResponse:
     """
-    Get notifications for the current month.
+    Get notifications for a specific month based on spending patterns and thresholds.
+    month must follow YYYY-MM format. Example: 2025-11
     """
-    from datetime import datetime
-    current_month = datetime.utcnow().strftime("%Y-%m")
-    return get_notifications(current_month, user_id)
+    return ORJSONResponse(_build_notifications(month, user_id))
+
 
+@router.get("/", response_class=ORJSONResponse)
+def get_current_month_notifications(user_id: str = Depends(get_current_user_id)) -> ORJSONResponse:
+    """
+    Get notifications for the current month.
+    """
+    return ORJSONResponse(_build_notifications(time.strftime("%Y-%m", time.gmtime()), user_id))
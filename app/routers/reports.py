@@ -1,41 +1,27 @@
+import logging
 import uuid
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
 
-from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer
 
-from app.core.config import settings
-from app.core.security import decode_access_token
+from app.core.deps import get_current_user_id, get_finance_analyzer
 from app.db import dynamo
 from app.utils import pdf_report
-from app.utils.analyzer import FinanceAnalyzer
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
-finance_analyzer = FinanceAnalyzer(settings.BUDGET_THRESHOLDS_JSON)
+# Runs a report's PDF and CSV uploads side by side
+_REPORT_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="report-upload")
 
 
-def get_current_user_id(authorization: Optional[str] = Header(None)) -> str:
-    # JWT token authentication
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Token required")
-    
-    token = authorization.replace("Bearer ", "")
-    payload = decode_access_token(token)
-    user_id = payload.get("sub")
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Invalid token")
-    return user_id
-
-
-@router.get("/monthly/{month}")
-def generate_monthly_report(month: str, user_id: str = Depends(get_current_user_id)) -> Dict:
+@router.get("/monthly/{month}", response_class=ORJSONResponse)
+def generate_monthly_report(month: str, user_id: str = Depends(get_current_user_id)) -> ORJSONResponse:
     """
     Generate report for the given month (e.g., '2025-11'), upload to S3, return insights + download link.
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
     try:
         logger.info(f"Generating monthly report for user_id: {user_id}, month: {month}")
         
@@ -46,6 +32,7 @@ def generate_monthly_report(month: str, user_id: str = Depends(get_current_user_
             raise HTTPException(status_code=404, detail="No expenses found for this month.")
 
         # Load user's thresholds for analysis
+        finance_analyzer = get_finance_analyzer()
         thresholds = finance_analyzer.load_thresholds(user_id=user_id)
         
         # Analyze expenses via the reusable finance_analyzer_lib
@@ -59,24 +46,31 @@ def generate_monthly_report(month: str, user_id: str = Depends(get_current_user_
         # Generate report files & upload to S3
         report_id = f"{user_id}_{month}_{uuid.uuid4().hex[:6]}"
         
+        # Build and upload the PDF and CSV concurrently; each upload mostly waits on S3
+        pdf_future = _REPORT_EXECUTOR.submit(
+            pdf_report.generate_and_upload_pdf,
+            user_id=user_id,
+            month=month,
+            expenses=expenses,
+            total=summary["monthly_total"],
+            overspending=summary["overspending_categories"],
+            suggested=summary["suggested_budgets"],
+            spikes=summary["spending_spikes"],
+            report_id=report_id,
+        )
+        csv_future = _REPORT_EXECUTOR.submit(
+            pdf_report.generate_and_upload_csv, user_id, month, expenses, report_id
+        )
+
         try:
-            pdf_url = pdf_report.generate_and_upload_pdf(
-                user_id=user_id,
-                month=month,
-                expenses=expenses,
-                total=summary["monthly_total"],
-                overspending=summary["overspending_categories"],
-                suggested=summary["suggested_budgets"],
-                spikes=summary["spending_spikes"],
-                report_id=report_id,
-            )
+            pdf_url = pdf_future.result()
             logger.info(f"PDF uploaded: {pdf_url}")
         except Exception as e:
             logger.error(f"Error uploading PDF: {str(e)}")
             pdf_url = None
         
         try:
-            csv_url = pdf_report.generate_and_upload_csv(user_id, month, expenses, report_id)
+            csv_url = csv_future.result()
             logger.info(f"CSV uploaded: {csv_url}")
         except Exception as e:
             logger.error(f"Error uploading CSV: {str(e)}")
@@ -84,7 +78,9 @@ def generate_monthly_report(month: str, user_id: str = Depends(get_current_user_
 
         # Note: Email is only sent automatically via monthly scheduler, not for manual report generation
 
-        return {
+        # Returned as a response directly so FastAPI doesn't re-encode the
+        # insights and spikes through jsonable_encoder first
+        return ORJSONResponse({
             "month": month,
             "total_spent": summary["monthly_total"],
             "overspending_categories": summary["overspending_categories"],
@@ -93,7 +89,7 @@ def generate_monthly_report(month: str, user_id: str = Depends(get_current_user_
             "insights": summary["insights"],
             "pdf_report_url": pdf_url,
             "csv_report_url": csv_url,
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -2,59 +2,97 @@
 Settings Router
 Provides endpoints to control scheduler and manage application settings
 """
+import hashlib
 from typing import Dict, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Header
-from pydantic import BaseModel
 
-from app.core.security import decode_access_token
+import orjson
+from anyio import to_thread
+from botocore.exceptions import BotoCoreError, ClientError
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, validator
+
+from app.core.deps import get_current_user_id
 from app.db import dynamo
 from app.utils.scheduler import (
+    get_monthly_reports_job,
+    get_running_scheduler,
     get_scheduler_status,
     start_scheduler,
-    stop_scheduler,
-    scheduler
 )
-from apscheduler.triggers.cron import CronTrigger
 import logging
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
 
-def get_current_user_id(authorization: Optional[str] = Header(None)) -> str:
-    """Extract user_id from JWT token"""
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token required")
-    
-    token = authorization.replace("Bearer ", "")
-    payload = decode_access_token(token)
-    user_id = payload.get("sub")
-    if not user_id:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-    return user_id
-
-
 class SchedulerScheduleUpdate(BaseModel):
-    day: int  # Day of month (1-31)
-    hour: int  # Hour (0-23)
-    minute: int  # Minute (0-59)
+    day: int = Field(..., ge=1, le=31)  # Day of month
+    hour: int = Field(..., ge=0, le=23)
+    minute: int = Field(..., ge=0, le=59)
 
 
 class BudgetThresholdsUpdate(BaseModel):
     thresholds: Dict[str, float]  # Category name -> amount
 
+    @validator("thresholds")
+    def _non_negative(cls, thresholds: Dict[str, float]) -> Dict[str, float]:
+        # Rejected while parsing the body, before the handler is dispatched
+        for category, amount in thresholds.items():
+            if amount < 0:
+                raise ValueError(f"Threshold for {category} must be positive")
+        return thresholds
+
+
+def _etag_response(request: Request, payload: Dict) -> Response:
+    """
+    JSON response tagged with a digest of its body. Clients polling with
+    If-None-Match get an empty 304 while the settings are unchanged.
+    """
+    body = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
+
+# The GET endpoints are async: a cache hit is answered on the event loop and
+# only a miss is sent to a worker thread for the blocking DynamoDB read
 
 @router.get("/scheduler")
-def get_scheduler_settings(user_id: str = Depends(get_current_user_id)) -> Dict:
+async def get_scheduler_settings(request: Request, user_id: str = Depends(get_current_user_id)) -> Response:
     """
     Get current scheduler status and configuration for the current user.
     Loads settings from DynamoDB.
     """
+    # Get user's personal scheduler settings from DynamoDB
+    db_settings = dynamo.get_scheduler_settings_if_cached(user_id)
+    if db_settings is None:
+        db_settings = await to_thread.run_sync(dynamo.get_scheduler_settings, user_id)
+    return _etag_response(request, _scheduler_payload(db_settings))
+
+
+@router.get("/bundle")
+async def get_settings_bundle(request: Request, user_id: str = Depends(get_current_user_id)) -> Response:
+    """
+    Scheduler settings and budget thresholds in one response, read together in
+    a single DynamoDB call; the settings page needs both.
+    """
+    db_settings = dynamo.get_scheduler_settings_if_cached(user_id)
+    thresholds = dynamo.get_budget_thresholds_if_cached(user_id)
+    if db_settings is None or thresholds is None:
+        db_settings, thresholds = await to_thread.run_sync(dynamo.get_user_settings, user_id)
+    return _etag_response(request, {
+        "scheduler": _scheduler_payload(db_settings),
+        "thresholds": thresholds or {},
+    })
+
+
+def _scheduler_payload(db_settings: Optional[Dict]) -> Dict:
+    """Body of GET /scheduler for a user's stored settings (None if they have none)."""
     # Get system-wide scheduler status (is the scheduler service running?)
     status_info = get_scheduler_status()
     
-    # Get user's personal scheduler settings from DynamoDB
-    db_settings = dynamo.get_scheduler_settings(user_id)
     enabled = db_settings.get("enabled", False) if db_settings else False
     
     # Get actual schedule from running scheduler job (not from database)
@@ -66,38 +104,37 @@ def get_scheduler_settings(user_id: str = Depends(get_current_user_id)) -> Dict:
     }
     
     # Get actual schedule from running scheduler if available (system-wide)
-    if scheduler and scheduler.running:
-        job = scheduler.get_job("monthly_expense_reports")
-        if job and job.trigger:
-            # Extract schedule from the cron trigger
-            trigger = job.trigger
-            try:
-                # CronTrigger stores day, hour, minute as attributes
-                if hasattr(trigger, 'day') and trigger.day is not None:
-                    # If day is a set, get the first value, otherwise use the value directly
-                    if isinstance(trigger.day, set):
-                        current_schedule["day"] = list(trigger.day)[0] if trigger.day else 1
-                    else:
-                        current_schedule["day"] = trigger.day
-                
-                if hasattr(trigger, 'hour') and trigger.hour is not None:
-                    if isinstance(trigger.hour, set):
-                        current_schedule["hour"] = list(trigger.hour)[0] if trigger.hour else 0
-                    else:
-                        current_schedule["hour"] = trigger.hour
-                
-                if hasattr(trigger, 'minute') and trigger.minute is not None:
-                    if isinstance(trigger.minute, set):
-                        current_schedule["minute"] = list(trigger.minute)[0] if trigger.minute else 0
-                    else:
-                        current_schedule["minute"] = trigger.minute
-            except Exception as e:
-                logger.warning(f"Could not extract schedule from trigger: {str(e)}")
-                # Keep defaults
+    job = get_monthly_reports_job()
+    if job and job.trigger:
+        # Extract schedule from the cron trigger
+        trigger = job.trigger
+        try:
+            # CronTrigger stores day, hour, minute as attributes
+            if hasattr(trigger, 'day') and trigger.day is not None:
+                # If day is a set, get the first value, otherwise use the value directly
+                if isinstance(trigger.day, set):
+                    current_schedule["day"] = list(trigger.day)[0] if trigger.day else 1
+                else:
+                    current_schedule["day"] = trigger.day
             
-            # Get next run time
-            if job.next_run_time:
-                current_schedule["next_run"] = job.next_run_time.isoformat()
+            if hasattr(trigger, 'hour') and trigger.hour is not None:
+                if isinstance(trigger.hour, set):
+                    current_schedule["hour"] = list(trigger.hour)[0] if trigger.hour else 0
+                else:
+                    current_schedule["hour"] = trigger.hour
+            
+            if hasattr(trigger, 'minute') and trigger.minute is not None:
+                if isinstance(trigger.minute, set):
+                    current_schedule["minute"] = list(trigger.minute)[0] if trigger.minute else 0
+                else:
+                    current_schedule["minute"] = trigger.minute
+        except Exception as e:
+            logger.warning(f"Could not extract schedule from trigger: {str(e)}")
+            # Keep defaults
+        
+        # Get next run time
+        if job.next_run_time:
+            current_schedule["next_run"] = job.next_run_time.isoformat()
     
     return {
         "service_running": status_info.get("running", False),  # System-wide scheduler service status
@@ -108,67 +145,48 @@ def get_scheduler_settings(user_id: str = Depends(get_current_user_id)) -> Dict:
 
 
 @router.post("/scheduler/start")
-def start_scheduler_endpoint(user_id: str = Depends(get_current_user_id)) -> Dict:
+def start_scheduler_endpoint(user_id: str = Depends(get_current_user_id)) -> ORJSONResponse:
     """
     Enable scheduler for the current user and ensure system scheduler is running.
     """
     try:
-        # Get user's current settings
-        db_settings = dynamo.get_scheduler_settings(user_id)
-        if not db_settings:
-            # Initialize defaults
-            dynamo.initialize_default_scheduler_settings(user_id)
-            db_settings = dynamo.get_scheduler_settings(user_id)
-        
-        day = db_settings.get("day", 1)
-        hour = db_settings.get("hour", 6)
-        minute = db_settings.get("minute", 0)
-        
-        # Enable scheduler for this user
-        dynamo.save_scheduler_settings(user_id, day, hour, minute, enabled=True)
+        # One write enables the flag and fills in a default schedule if the user
+        # has none yet; no read or separate initialisation needed
+        if not dynamo.set_scheduler_enabled(user_id, True):
+            raise HTTPException(status_code=500, detail="Failed to enable scheduler")
         
         # Ensure system-wide scheduler service is running
-        if scheduler is None or not scheduler.running:
+        if get_running_scheduler() is None:
             start_scheduler()
         
-        return {
+        return ORJSONResponse({
             "success": True,
             "message": "Scheduler enabled for your account. Monthly reports will be generated automatically.",
             "status": get_scheduler_status()
-        }
-    except Exception as e:
+        })
+    except (BotoCoreError, ClientError) as e:
         logger.error(f"Error enabling scheduler: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to enable scheduler: {str(e)}")
 
 
 @router.post("/scheduler/stop")
-def stop_scheduler_endpoint(user_id: str = Depends(get_current_user_id)) -> Dict:
+def stop_scheduler_endpoint(user_id: str = Depends(get_current_user_id)) -> ORJSONResponse:
     """
     Disable scheduler for the current user (doesn't stop system scheduler for other users).
     """
     try:
-        # Get user's current settings
-        db_settings = dynamo.get_scheduler_settings(user_id)
-        if not db_settings:
-            # Initialize defaults
-            dynamo.initialize_default_scheduler_settings(user_id)
-            db_settings = dynamo.get_scheduler_settings(user_id)
-        
-        day = db_settings.get("day", 1)
-        hour = db_settings.get("hour", 6)
-        minute = db_settings.get("minute", 0)
-        
         # Disable scheduler for this user only
-        dynamo.save_scheduler_settings(user_id, day, hour, minute, enabled=False)
+        if not dynamo.set_scheduler_enabled(user_id, False):
+            raise HTTPException(status_code=500, detail="Failed to disable scheduler")
         
         # Note: We don't stop the system scheduler as other users might have it enabled
         
-        return {
+        return ORJSONResponse({
             "success": True,
             "message": "Scheduler disabled for your account. Monthly reports will not be generated automatically.",
             "status": get_scheduler_status()
-        }
-    except Exception as e:
+        })
+    except (BotoCoreError, ClientError) as e:
         logger.error(f"Error disabling scheduler: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to disable scheduler: {str(e)}")
 
@@ -177,43 +195,32 @@ def stop_scheduler_endpoint(user_id: str = Depends(get_current_user_id)) -> Dict
 def update_scheduler_schedule(
     schedule: SchedulerScheduleUpdate,
     user_id: str = Depends(get_current_user_id)
-) -> Dict:
+) -> ORJSONResponse:
     """
     Update the scheduler cron schedule.
     Requires scheduler to be restarted to take effect.
     """
-    # Validate inputs
-    if not (1 <= schedule.day <= 31):
-        raise HTTPException(status_code=400, detail="Day must be between 1 and 31")
-    if not (0 <= schedule.hour <= 23):
-        raise HTTPException(status_code=400, detail="Hour must be between 0 and 23")
-    if not (0 <= schedule.minute <= 59):
-        raise HTTPException(status_code=400, detail="Minute must be between 0 and 59")
-    
     try:
         logger.info(f"Updating schedule for user {user_id}: day={schedule.day}, hour={schedule.hour}, minute={schedule.minute}")
         
-        # Get user's current enabled state
-        db_settings = dynamo.get_scheduler_settings(user_id)
-        enabled = db_settings.get("enabled", False) if db_settings else False
-        logger.info(f"User {user_id} scheduler enabled status: {enabled}")
-        
-        # Save user's schedule preference to DB
-        dynamo.save_scheduler_settings(user_id, schedule.day, schedule.hour, schedule.minute, enabled=enabled)
-        logger.info(f"Saved schedule to database for user {user_id}")
+        # Save user's schedule preference to DB; the enabled flag is left as is
+        # and comes back with the write, so nothing has to be read first
+        db_settings = dynamo.update_schedule_fields(user_id, schedule.day, schedule.hour, schedule.minute)
+        if db_settings is None:
+            raise HTTPException(status_code=500, detail="Failed to update schedule")
+        logger.info(f"Saved schedule to database for user {user_id} (enabled: {db_settings['enabled']})")
         
         # Schedule is fixed at 1st day 00:00 UTC - no need to update scheduler job
         # Just save user's preference (for display purposes only)
         
         # Get next run time if scheduler is running (system-wide, always 1st day 00:00)
         next_run = None
-        if scheduler and scheduler.running:
-            job = scheduler.get_job("monthly_expense_reports")
-            if job and job.next_run_time:
-                next_run = job.next_run_time.isoformat()
-                logger.info(f"Next run time: {next_run}")
+        job = get_monthly_reports_job()
+        if job and job.next_run_time:
+            next_run = job.next_run_time.isoformat()
+            logger.info(f"Next run time: {next_run}")
         
-        return {
+        return ORJSONResponse({
             "success": True,
             "message": "Schedule preference saved. Monthly reports run on the 1st day of each month at 00:00 UTC for all users.",
             "schedule": {
@@ -222,50 +229,44 @@ def update_scheduler_schedule(
                 "minute": 0,
                 "next_run": next_run
             }
-        }
-    except Exception as e:
+        })
+    except (BotoCoreError, ClientError) as e:
         logger.error(f"Error updating scheduler schedule: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to update schedule: {str(e)}")
 
 
 @router.get("/thresholds")
-def get_budget_thresholds(user_id: str = Depends(get_current_user_id)) -> Dict:
+async def get_budget_thresholds(request: Request, user_id: str = Depends(get_current_user_id)) -> Response:
     """
     Get current budget thresholds from DynamoDB for the current user.
     """
-    thresholds = dynamo.get_budget_thresholds(user_id)
+    thresholds = dynamo.get_budget_thresholds_if_cached(user_id)
     if thresholds is None:
-        # Return empty dict if not found
-        return {"thresholds": {}}
-    
-    return {"thresholds": thresholds}
+        thresholds = await to_thread.run_sync(dynamo.get_budget_thresholds, user_id)
+    # Empty dict if not found
+    return _etag_response(request, {"thresholds": thresholds or {}})
 
 
 @router.put("/thresholds")
 def update_budget_thresholds(
     update: BudgetThresholdsUpdate,
     user_id: str = Depends(get_current_user_id)
-) -> Dict:
+) -> ORJSONResponse:
     """
     Update budget thresholds in DynamoDB.
     These thresholds are used for notifications when spending crosses limits.
     """
-    # Validate thresholds (all values must be positive)
-    for category, amount in update.thresholds.items():
-        if amount < 0:
-            raise HTTPException(status_code=400, detail=f"Threshold for {category} must be positive")
-    
     try:
         success = dynamo.save_budget_thresholds(user_id, update.thresholds)
         if not success:
             raise HTTPException(status_code=500, detail="Failed to save budget thresholds")
         
-        return {
+        return ORJSONResponse({
             "success": True,
             "message": "Budget thresholds updated successfully",
             "thresholds": update.thresholds
-        }
-    except Exception as e:
+        })
+    except (BotoCoreError, ClientError) as e:
         logger.error(f"Error updating budget thresholds: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to update thresholds: {str(e)}")
 
@@ -7,6 +7,9 @@ from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+# Headroom added on top of average spend when suggesting a category budget
+DEFAULT_BUDGET_BUFFER = 0.15
+
 
 @dataclass
 class CategoryInsight:
@@ -71,17 +74,19 @@ class FinanceAnalyzer:
             return json.load(fp)
 
     def load_thresholds(self, user_id: Optional[str] = None, overrides: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+        """
+        Thresholds for `user_id` (DynamoDB first, then the file defaults loaded at
+        construction), with `overrides` applied on top. Without overrides the
+        shared mapping is returned as-is and must be treated as read-only.
+        """
         # Always check DB first (in case thresholds were updated)
         db_thresholds = self._load_budget_thresholds_from_db(user_id) if user_id else None
-        if db_thresholds:
-            base_thresholds = db_thresholds
-        else:
-            # Fallback to cached thresholds or file
-            base_thresholds = self._budget_thresholds or self._load_budget_thresholds(self._budget_config_path)
-        
+        base_thresholds = db_thresholds or self._budget_thresholds
+        if not overrides:
+            return base_thresholds
+
         merged = dict(base_thresholds)
-        if overrides:
-            merged.update(overrides)
+        merged.update(overrides)
         return merged
 
     def monthly_total(self, expenses: List[Dict[str, Any]]) -> float:
@@ -98,11 +103,17 @@ class FinanceAnalyzer:
         expenses: List[Dict[str, Any]],
         budget_overrides: Optional[Dict[str, float]] = None,
     ) -> Dict[str, float]:
-        thresholds = self.load_thresholds(budget_overrides)
+        return self._overspent(self.category_totals(expenses), budget_overrides)
+
+    def _overspent(
+        self,
+        totals: Dict[str, float],
+        budget_overrides: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, float]:
+        thresholds = self.load_thresholds(overrides=budget_overrides)
         if not thresholds:
             return {}
 
-        totals = self.category_totals(expenses)
         overspent = {
             cat: amount
             for cat, amount in totals.items()
@@ -110,18 +121,30 @@ class FinanceAnalyzer:
         }
         return overspent
 
+    @staticmethod
+    def _amounts(expenses: List[Dict[str, Any]]) -> List[float]:
+        return [float(exp.get("amount", 0)) for exp in expenses]
+
+    @staticmethod
+    def _category_amounts(expenses: List[Dict[str, Any]], amounts: List[float]) -> Dict[str, List[float]]:
+        category_spend: Dict[str, List[float]] = defaultdict(list)
+        for exp, amount in zip(expenses, amounts):
+            category_spend[exp["category"]].append(amount)
+        return category_spend
+
     def suggest_budget(
         self,
         expenses: List[Dict[str, Any]],
-        buffer_percentage: float = 0.15,
+        buffer_percentage: float = DEFAULT_BUDGET_BUFFER,
     ) -> Dict[str, float]:
         """
         Suggests a budget using average spend plus a configurable buffer.
         """
-        category_spend: Dict[str, List[float]] = defaultdict(list)
-        for exp in expenses:
-            category_spend[exp["category"]].append(float(exp.get("amount", 0)))
+        category_spend = self._category_amounts(expenses, self._amounts(expenses))
+        return self._suggest_from(category_spend, buffer_percentage)
 
+    @staticmethod
+    def _suggest_from(category_spend: Dict[str, List[float]], buffer_percentage: float) -> Dict[str, float]:
         suggestions = {}
         for category, amounts in category_spend.items():
             avg = statistics.fmean(amounts)
@@ -137,14 +160,14 @@ class FinanceAnalyzer:
         """
         if not expenses:
             return []
+        return self._spikes(expenses, self._amounts(expenses))
 
-        amounts = [float(exp.get("amount", 0)) for exp in expenses]
+    def _spikes(self, expenses: List[Dict[str, Any]], amounts: List[float]) -> List[Dict[str, Any]]:
         mean = statistics.fmean(amounts)
         stdev = statistics.pstdev(amounts)
 
         anomalies: List[Dict[str, Any]] = []
-        for exp in expenses:
-            amount = float(exp.get("amount", 0))
+        for exp, amount in zip(expenses, amounts):
             if amount < self._minimum_spike_amount:
                 continue
             if stdev == 0:
@@ -170,34 +193,35 @@ class FinanceAnalyzer:
                 "insights": [],
             }
 
-        category_map: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-        for exp in expenses:
-            category_map[exp["category"]].append(exp)
+        # Convert amounts and split them by category once; every metric below
+        # works from these instead of walking the expenses again
+        amounts = self._amounts(expenses)
+        category_spend = self._category_amounts(expenses, amounts)
 
         category_totals = {
-            category: round(sum(float(item.get("amount", 0)) for item in items), 2)
-            for category, items in category_map.items()
+            category: round(sum(values), 2)
+            for category, values in category_spend.items()
         }
-        suggestions = self.suggest_budget(expenses)
-        overspent = self.overspending_categories(expenses, budget_overrides)
+        suggestions = self._suggest_from(category_spend, DEFAULT_BUDGET_BUFFER)
+        overspent = self._overspent(category_totals, budget_overrides)
 
         insights = [
             CategoryInsight(
                 category=category,
                 total=category_totals[category],
-                average=round(category_totals[category] / len(items), 2),
-                transaction_count=len(items),
+                average=round(category_totals[category] / len(values), 2),
+                transaction_count=len(values),
                 overspent=category in overspent,
                 suggested_budget=suggestions.get(category),
             ).to_dict()
-            for category, items in category_map.items()
+            for category, values in category_spend.items()
         ]
 
         return {
-            "monthly_total": self.monthly_total(expenses),
+            "monthly_total": round(sum(amounts), 2),
             "category_totals": category_totals,
             "overspending_categories": overspent,
             "suggested_budgets": suggestions,
-            "spending_spikes": self.detect_spending_spikes(expenses),
+            "spending_spikes": self._spikes(expenses, amounts),
             "insights": insights,
         }
@@ -11,8 +11,6 @@ from email.mime.base import MIMEBase
 from email import encoders
 from typing import Optional, List
 
-from app.core.config import settings
-
 logger = logging.getLogger(__name__)
 
 
@@ -126,7 +124,7 @@ def send_monthly_report_email(
     try:
         month_date = datetime.strptime(month, "%Y-%m")
         month_display = month_date.strftime("%B %Y")
-    except:
+    except (ValueError, TypeError):
         month_display = month
     
     # Build HTML email body
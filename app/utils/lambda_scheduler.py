@@ -8,24 +8,48 @@ from datetime import datetime
 from typing import Optional
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+from app.utils.ttl_cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
 # AWS Configuration
 LAMBDA_FUNCTION_NAME = os.getenv("LAMBDA_FUNCTION_NAME", "smart-expense-monthly-reports")
 AWS_REGION = os.getenv("AWS_REGION", "eu-west-1")
 
-# Initialize Lambda client
-lambda_client = boto3.client("lambda", region_name=AWS_REGION)
+# Initialize Lambda client; keep-alive lets status probes and invocations reuse
+# the open connection instead of a fresh TLS handshake each time
+lambda_client = boto3.client("lambda", region_name=AWS_REGION, config=Config(tcp_keepalive=True))
+
+
+# GetFunction results for status endpoints; the function's configuration only
+# changes on deploy, so polling dashboards don't need a control-plane call each time
+_function_info_cache = TTLCache(ttl=20, maxsize=1)
+
+
+def get_function_cached() -> dict:
+    """GetFunction response for the reports Lambda, cached for 20 seconds."""
+    return _function_info_cache.get_or_load(
+        LAMBDA_FUNCTION_NAME,
+        lambda: lambda_client.get_function(FunctionName=LAMBDA_FUNCTION_NAME),
+    )
+
+
+def get_function_if_cached() -> Optional[dict]:
+    """The cached GetFunction response, or None; never calls AWS."""
+    return _function_info_cache.get(LAMBDA_FUNCTION_NAME)
 
 
-def invoke_lambda_function(payload: Optional[dict] = None) -> dict:
+def invoke_lambda_function(payload: Optional[dict] = None, invocation_type: str = "RequestResponse") -> dict:
     """
     Invoke the monthly expense reports Lambda function.
     
     Args:
         payload: Optional payload to send to Lambda (default: {})
+        invocation_type: "RequestResponse" waits for the run to finish; "Event"
+            returns as soon as Lambda has queued it (no result payload)
         
     Returns:
         dict: Response from Lambda function
@@ -40,7 +64,7 @@ def invoke_lambda_function(payload: Optional[dict] = None) -> dict:
         
         response = lambda_client.invoke(
             FunctionName=LAMBDA_FUNCTION_NAME,
-            InvocationType="RequestResponse",  # Synchronous invocation
+            InvocationType=invocation_type,
             Payload=json_lib.dumps(payload).encode('utf-8') if payload else b'{}'
         )
         
@@ -80,11 +104,12 @@ def invoke_lambda_function(payload: Optional[dict] = None) -> dict:
         }
 
 
-def trigger_monthly_reports() -> dict:
+def trigger_monthly_reports(wait: bool = True) -> dict:
     """
     Trigger monthly expense reports for all users with scheduler enabled.
     This is called by the scheduler.
     Lambda will handle finding enabled users and processing them.
+    With wait=False the invocation is queued asynchronously and returns at once.
     """
     logger.info(f"Triggering monthly reports at {datetime.utcnow()}")
     logger.info("Lambda will handle finding enabled users and processing reports")
@@ -96,5 +121,5 @@ def trigger_monthly_reports() -> dict:
     }
     
     logger.info(f"Invoking Lambda with payload: {payload}")
-    return invoke_lambda_function(payload)
+    return invoke_lambda_function(payload, invocation_type="RequestResponse" if wait else "Event")
 
@@ -2,12 +2,32 @@ import csv
 import io
 from fpdf import FPDF
 from datetime import datetime
+from functools import lru_cache
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from app.core.config import settings
+from app.core.config import get_settings
 
-# Initialize S3 client
-s3 = boto3.client("s3", region_name=settings.S3_REGION)
+
+@lru_cache(maxsize=1)
+def s3_client():
+    """
+    S3 client built on first use. Concurrent report uploads share it, so the
+    pool is sized above botocore's default of 10 and sockets are kept alive.
+    """
+    return boto3.client(
+        "s3",
+        region_name=get_settings().S3_REGION,
+        config=Config(tcp_keepalive=True, max_pool_connections=32),
+    )
+
+
+@lru_cache(maxsize=1)
+def _report_url_prefix() -> str:
+    # Report objects are addressed by a plain virtual-hosted URL (nothing is
+    # presigned), so the bucket/region part only needs formatting once
+    current = get_settings()
+    return f"https://{current.S3_BUCKET_NAME}.s3.{current.S3_REGION}.amazonaws.com/"
 
 
 def generate_and_upload_pdf(user_id, month, expenses, total, overspending, suggested, spikes, report_id):
@@ -56,30 +76,43 @@ def generate_and_upload_pdf(user_id, month, expenses, total, overspending, sugge
 
     s3_key = f"reports/{user_id}/{report_id}.pdf"
     try:
-        s3.upload_fileobj(buffer, settings.S3_BUCKET_NAME, s3_key, ExtraArgs={"ContentType": "application/pdf"})
-        return f"https://{settings.S3_BUCKET_NAME}.s3.{settings.S3_REGION}.amazonaws.com/{s3_key}"
+        s3_client().upload_fileobj(
+            buffer,
+            get_settings().S3_BUCKET_NAME,
+            s3_key,
+            ExtraArgs={"ContentType": "application/pdf"},
+        )
+        return _report_url_prefix() + s3_key
     except ClientError as e:
         print(f"[ERROR] Failed to upload PDF: {e}")
         return None
 
 
 def generate_and_upload_csv(user_id, month, expenses, report_id):
-    output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=["category", "amount", "description", "timestamp"])
-    writer.writeheader()
-    for e in expenses:
-        writer.writerow({
-            "category": e["category"],
-            "amount": e["amount"],
-            "description": e.get("description", ""),
-            "timestamp": e["timestamp"],
-        })
+    # Encode rows straight into the upload buffer rather than building the whole
+    # CSV as a str and then copying it again with .encode()
+    csv_buffer = io.BytesIO()
+    text = io.TextIOWrapper(csv_buffer, encoding="utf-8", newline="")
+    writer = csv.writer(text)
+    writer.writerow(("category", "amount", "description", "timestamp"))
+    writer.writerows(
+        (e["category"], e["amount"], e.get("description", ""), e["timestamp"])
+        for e in expenses
+    )
+    text.flush()
+    # Detach so the wrapper doesn't close the buffer when it is garbage collected
+    text.detach()
+    csv_buffer.seek(0)
 
-    csv_buffer = io.BytesIO(output.getvalue().encode())
     s3_key = f"reports/{user_id}/{report_id}.csv"
     try:
-        s3.upload_fileobj(csv_buffer, settings.S3_BUCKET_NAME, s3_key, ExtraArgs={"ContentType": "text/csv"})
-        return f"https://{settings.S3_BUCKET_NAME}.s3.{settings.S3_REGION}.amazonaws.com/{s3_key}"
+        s3_client().upload_fileobj(
+            csv_buffer,
+            get_settings().S3_BUCKET_NAME,
+            s3_key,
+            ExtraArgs={"ContentType": "text/csv"},
+        )
+        return _report_url_prefix() + s3_key
     except ClientError as e:
         print(f"[ERROR] Failed to upload CSV: {e}")
         return None
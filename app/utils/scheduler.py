@@ -4,22 +4,32 @@ Manages background tasks and cron jobs using APScheduler
 """
 import logging
 import os
+from datetime import datetime, timezone
+from typing import Optional
+
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
 from app.utils.lambda_scheduler import trigger_monthly_reports
+from app.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 # Scheduler instance (exported for use in settings router)
 scheduler: BackgroundScheduler = None
 
+# Status snapshot shared by concurrent callers for up to a second; dropped
+# whenever the scheduler is started or stopped
+_status_cache = TTLCache(ttl=1, maxsize=1)
+
+# The single system-wide job that triggers the monthly reports Lambda
+MONTHLY_REPORTS_JOB_ID = "monthly_expense_reports"
+
 
 def monthly_reports_job():
     """Job function to trigger monthly expense reports for all enabled users"""
-    from datetime import datetime
     logger.info("=" * 80)
     logger.info("CRON JOB TRIGGERED!")
     logger.info(f"Triggered at: {datetime.utcnow().isoformat()} UTC")
@@ -65,9 +75,6 @@ def start_scheduler():
     hour = 0
     minute = 0
     
-    from datetime import datetime, timezone
-    import time
-    
     logger.info(f"Schedule: First day of each month at {hour:02d}:{minute:02d} UTC")
     
     # Start scheduler FIRST
@@ -79,9 +86,8 @@ def start_scheduler():
         logger.error(f"Failed to start scheduler: {str(e)}", exc_info=True)
         raise
     
-    # Small delay to ensure scheduler is fully started
-    time.sleep(1.0)
-    logger.info("Scheduler startup delay completed")
+    # BackgroundScheduler.start() returns once the scheduler is running and
+    # add_job() registers the job synchronously, so no settle delay is needed
     
     # Add the job with monthly cron schedule (1st day of month)
     logger.info("Adding job to scheduler...")
@@ -93,7 +99,7 @@ def start_scheduler():
                 hour=hour,      # 00:00 UTC (midnight)
                 minute=minute   # Start of hour
             ),
-            id="monthly_expense_reports",
+            id=MONTHLY_REPORTS_JOB_ID,
             name="Monthly Expense Reports (1st day at 00:00 UTC)",
             replace_existing=True
         )
@@ -103,14 +109,13 @@ def start_scheduler():
         raise
     
     # Log detailed information
-    from datetime import timezone
     logger.info("=" * 80)
     logger.info("SCHEDULER STARTED")
     current_time = datetime.now(timezone.utc)
     logger.info(f"Current time: {current_time.isoformat()} UTC")
     
-    # Get job again to ensure it's registered
-    job = scheduler.get_job("monthly_expense_reports")
+    # add_job() on a running scheduler returns the stored job with its next
+    # run time already computed, so it is reused rather than looked up again
     if job:
         if job.next_run_time:
             logger.info(f"Next run: {job.next_run_time.isoformat()}")
@@ -128,17 +133,19 @@ def start_scheduler():
         logger.info(f"Job name: {job.name}")
         logger.info(f"Job trigger: {job.trigger}")
     else:
-        logger.error("Job 'monthly_expense_reports' not found in scheduler!")
+        logger.error(f"Job '{MONTHLY_REPORTS_JOB_ID}' not found in scheduler!")
     
     # Verify scheduler is running
     if scheduler.running:
         logger.info(f"Scheduler is RUNNING: {scheduler.running}")
-        logger.info(f"Number of jobs: {len(scheduler.get_jobs())}")
-        for j in scheduler.get_jobs():
+        jobs = scheduler.get_jobs()
+        logger.info(f"Number of jobs: {len(jobs)}")
+        for j in jobs:
             logger.info(f"  - Job: {j.id} ({j.name}), Next run: {j.next_run_time}")
     else:
         logger.error("Scheduler is NOT running!")
     
+    _status_cache.clear()
     logger.info("=" * 80)
 
 
@@ -149,6 +156,7 @@ def stop_scheduler():
     if scheduler is not None:
         scheduler.shutdown()
         scheduler = None
+        _status_cache.clear()
         logger.info("Scheduler stopped")
 
 
@@ -162,8 +170,29 @@ def refresh_scheduler_jobs():
     pass
 
 
+def get_running_scheduler() -> Optional[BackgroundScheduler]:
+    """
+    The scheduler instance if it is running, else None.
+    `scheduler` is rebound by start/stop, so callers in other modules read it
+    through this instead of importing the name (which would freeze its value).
+    """
+    if scheduler is not None and scheduler.running:
+        return scheduler
+    return None
+
+
+def get_monthly_reports_job():
+    """The monthly reports job, looked up by id, or None if the scheduler isn't running."""
+    running = get_running_scheduler()
+    return running.get_job(MONTHLY_REPORTS_JOB_ID) if running else None
+
+
 def get_scheduler_status():
-    """Get current scheduler status"""
+    """Get current scheduler status; the `jobs` list may be up to one second old."""
+    return _status_cache.get_or_load("status", _scheduler_status)
+
+
+def _scheduler_status():
     if scheduler is None:
         return {"running": False}
     
@@ -0,0 +1,20 @@
+"""
+Timestamp Helpers
+Cheap UTC timestamps for write paths that don't need sub-second precision
+"""
+import time
+from datetime import datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _iso_for_second(second: int) -> str:
+    return datetime.utcfromtimestamp(second).isoformat()
+
+
+def utc_now_iso_seconds() -> str:
+    """
+    Current UTC time as an ISO-8601 string truncated to the second.
+    The string is formatted once per second and reused by every caller in between.
+    """
+    return _iso_for_second(int(time.time()))
@@ -0,0 +1,148 @@
+"""
+TTL Cache
+Small thread-safe in-process cache with per-entry expiry
+"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Thread-safe mapping whose entries expire `ttl` seconds after they are stored.
+
+    With a non-zero `stale_ttl`, `get_or_load` keeps answering with an expired
+    entry for up to `stale_ttl` more seconds while a background thread reloads it
+    (stale-while-revalidate), so callers never wait on the refresh. Concurrent
+    misses for the same key share a single `loader()` call. The oldest entries
+    are evicted once `maxsize` is exceeded.
+
+    The cache is per process: with several workers, a write invalidates only the
+    local copy and other workers catch up when their entry expires.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024, stale_ttl: float = 0.0) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.stale_ttl = stale_ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        # Bumped on every set/pop so a load that started before an invalidation
+        # cannot store its (now outdated) result afterwards. Only cached keys and
+        # keys with a load in flight keep an entry, so pop churn can't grow it
+        self._versions: dict = {}
+        self._refreshing: set = set()
+        # In-flight loads by (key, version); a pop/set starts a new generation so
+        # callers after an invalidation never join a load that predates it
+        self._loading: dict = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the fresh value for `key`, or `default` if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return default
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._store(key, value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Drop `key` from the cache and return its last value."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if self._load_in_flight(key):
+                self._versions[key] = self._versions.get(key, 0) + 1
+            else:
+                # Nobody holds a version to compare against, so it can go
+                self._versions.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            in_flight = self._refreshing.union(key for key, _ in self._loading)
+            self._versions = {key: self._versions.get(key, 0) + 1 for key in in_flight}
+            self._entries.clear()
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for `key`, calling `loader()` on a miss.
+        `None` results are not cached, so lookups for missing records are retried.
+        """
+        now = time.monotonic()
+        # The version is read and the load registered under one lock, so a
+        # pop() in between always sees the load as in flight
+        with self._lock:
+            entry = self._entries.get(key)
+            version = self._versions.get(key, 0)
+            if entry is not None and now < entry[0]:
+                return entry[1]
+            stale = entry is not None and now < entry[0] + self.stale_ttl
+            if stale:
+                refresh = key not in self._refreshing
+                if refresh:
+                    self._refreshing.add(key)
+            else:
+                flight = (key, version)
+                pending = self._loading.get(flight)
+                leader = pending is None
+                if leader:
+                    pending = self._loading[flight] = Future()
+
+        if stale:
+            if refresh:
+                self._refresh_in_background(key, loader, version)
+            return entry[1]
+        if not leader:
+            return pending.result()
+        return self._load(flight, loader, pending)
+
+    def _load_in_flight(self, key: Hashable) -> bool:
+        # Caller holds the lock
+        return key in self._refreshing or any(loading == key for loading, _ in self._loading)
+
+    def _load(self, flight: tuple, loader: Callable[[], Any], pending: Future) -> Any:
+        key, version = flight
+        try:
+            value = loader()
+        except BaseException as exc:
+            pending.set_exception(exc)
+            raise
+        else:
+            self._store_if_current(key, value, version)
+            pending.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                self._loading.pop(flight, None)
+
+    def _refresh_in_background(self, key: Hashable, loader: Callable[[], Any], version: int) -> None:
+        # Caller has already added `key` to _refreshing
+        def refresh() -> None:
+            try:
+                self._store_if_current(key, loader(), version)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _store_if_current(self, key: Hashable, value: Optional[Any], version: int) -> None:
+        if value is None:
+            return
+        with self._lock:
+            if self._versions.get(key, 0) == version:
+                self._store(key, value)
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        # Caller holds the lock
+        self._versions[key] = self._versions.get(key, 0) + 1
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            evicted, _ = self._entries.popitem(last=False)
+            if not self._load_in_flight(evicted):
+                self._versions.pop(evicted, None)
@@ -0,0 +1,14 @@
+"""
+One-off migration for the scheduler-enabled-index GSI.
+Users who enabled the scheduler before the index existed have
+scheduler_enabled = true but no scheduler_enabled_key, so the monthly job's
+index query skips them. Run this once after creating the index; re-running is safe.
+
+Usage:
+    python backfill_scheduler_index.py
+"""
+from app.db import dynamo
+
+if __name__ == "__main__":
+    updated = dynamo.backfill_scheduler_enabled_index()
+    print(f"Backfilled {dynamo.SCHEDULER_ENABLED_INDEX_KEY} for {updated} user(s)")
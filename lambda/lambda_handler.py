@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+import time
 from datetime import datetime
 from decimal import Decimal
 
@@ -20,6 +21,7 @@ USERS_TABLE = os.environ.get("DYNAMO_TABLE_USERS", "smart-expense-users")
 EXPENSES_TABLE = os.environ.get("DYNAMO_TABLE_EXPENSES", "smart-expense-expenses")
 S3_BUCKET = os.environ.get("S3_BUCKET_NAME", "smart-expense-reports-2025")
 S3_REGION = os.environ.get("S3_REGION", "eu-west-1")
+SCHEDULER_ENABLED_INDEX = os.environ.get("SCHEDULER_ENABLED_INDEX", "scheduler-enabled-index")
 
 # Initialize AWS clients
 dynamodb = boto3.resource("dynamodb", region_name=DYNAMO_REGION)
@@ -28,6 +30,13 @@ s3 = boto3.client("s3", region_name=S3_REGION) if S3_BUCKET else None
 users_table = dynamodb.Table(USERS_TABLE)
 expenses_table = dynamodb.Table(EXPENSES_TABLE)
 
+# Open the DynamoDB connection during init so the first invocation doesn't pay
+# for credential resolution and the TLS handshake
+try:
+    dynamodb.meta.client.describe_endpoints()
+except Exception as e:
+    logger.warning(f"DynamoDB warm-up failed: {e}")
+
 finance_analyzer = FinanceAnalyzer()
 
 
@@ -52,32 +61,46 @@ def lambda_handler(event, context):
                 logger.info(f"Processing reports for {len(user_ids_to_process)} specific users")
                 logger.info(f"User IDs to process: {user_ids_to_process}")
             else:
-                logger.info("No user_ids in event, will scan for users with scheduler_enabled=True")
+                logger.info("No user_ids in event, will query for users with scheduler enabled")
         
-        # Get users - either specific users or scan for enabled users
+        # Get users - either specific users or query for enabled users
         if user_ids_to_process:
-            # Get specific users (from manual trigger with user_ids)
+            # Get specific users (from manual trigger with user_ids) with BatchGetItem,
+            # 100 keys per request instead of one GetItem per user
             users = []
-            for user_id in user_ids_to_process:
+            unique_ids = list(dict.fromkeys(user_ids_to_process))
+            for start in range(0, len(unique_ids), 100):
+                request_items = {USERS_TABLE: {"Keys": [{"user_id": u} for u in unique_ids[start:start + 100]]}}
+                attempt = 0
                 try:
-                    logger.info(f"Fetching user: {user_id}")
-                    response = users_table.get_item(Key={"user_id": user_id})
-                    if "Item" in response:
-                        logger.info(f"Found user {user_id} in database")
-                        users.append(response["Item"])
-                    else:
-                        logger.warning(f"User {user_id} not found in database (table: {USERS_TABLE})")
+                    while request_items:
+                        response = dynamodb.batch_get_item(RequestItems=request_items)
+                        users.extend(response["Responses"].get(USERS_TABLE, []))
+                        request_items = response.get("UnprocessedKeys") or {}
+                        if request_items:
+                            time.sleep(min(0.05 * 2 ** attempt, 1.0))
+                            attempt += 1
                 except Exception as e:
-                    logger.error(f"Error fetching user {user_id}: {str(e)}", exc_info=True)
+                    logger.error(f"Error fetching users: {str(e)}", exc_info=True)
+            found_ids = {user["user_id"] for user in users}
+            for user_id in unique_ids:
+                if user_id not in found_ids:
+                    logger.warning(f"User {user_id} not found in database (table: {USERS_TABLE})")
             logger.info(f"Total users fetched: {len(users)}")
         else:
-            # Scan for users with scheduler_enabled=True (from scheduler trigger)
-            logger.info("Scanning for users with scheduler_enabled=True")
-            from boto3.dynamodb import conditions
-            response = users_table.scan(
-                FilterExpression=conditions.Attr("scheduler_enabled").eq(True)
-            )
-            users = response.get("Items", [])
+            # Query the sparse GSI that only holds users with the scheduler enabled
+            logger.info(f"Querying {SCHEDULER_ENABLED_INDEX} for users with scheduler enabled")
+            query_kwargs = {
+                "IndexName": SCHEDULER_ENABLED_INDEX,
+                "KeyConditionExpression": Key("scheduler_enabled_key").eq("true"),
+            }
+            users = []
+            while True:
+                response = users_table.query(**query_kwargs)
+                users.extend(response.get("Items", []))
+                if "LastEvaluatedKey" not in response:
+                    break
+                query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
             logger.info(f"Found {len(users)} users with scheduler enabled")
             
             # Filter out system config user if present
@@ -103,11 +126,18 @@ def lambda_handler(event, context):
                 user_id = user["user_id"]
                 email = user.get("email", "unknown")
 
-                # Query expenses for this user
-                response = expenses_table.query(
-                    KeyConditionExpression=Key("user_id").eq(user_id) & Key("expense_id").begins_with(month)
-                )
-                expenses = _from_dynamo(response.get("Items", []))
+                # Query expenses for this user, following LastEvaluatedKey past the 1 MB page limit
+                query_kwargs = {
+                    "KeyConditionExpression": Key("user_id").eq(user_id) & Key("expense_id").begins_with(month)
+                }
+                items = []
+                while True:
+                    response = expenses_table.query(**query_kwargs)
+                    items.extend(response.get("Items", []))
+                    if "LastEvaluatedKey" not in response:
+                        break
+                    query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+                expenses = _from_dynamo(items)
 
                 if not expenses:
                     logger.info(f"No expenses found for user {user_id} in {month}")
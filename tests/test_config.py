@@ -0,0 +1,62 @@
+import subprocess
+import sys
+from unittest import mock
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from botocore.stub import Stubber
+
+from app.core import config
+
+SECRET_ID = "arn:aws:secretsmanager:eu-west-1:123456789012:secret:jwt"
+
+
+@pytest.fixture
+def secretsmanager():
+    client = boto3.client(
+        "secretsmanager",
+        region_name="eu-west-1",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+    )
+    settings = config.Settings(JWT_SECRET_ID=SECRET_ID)
+    config.get_jwt_secret.cache_clear()
+    with mock.patch.object(config, "get_settings", return_value=settings), \
+            mock.patch.object(config, "_secretsmanager_client", return_value=client), \
+            Stubber(client) as stubber:
+        yield stubber
+    config.get_jwt_secret.cache_clear()
+
+
+def test_jwt_secret_read_from_secrets_manager_once(secretsmanager):
+    secretsmanager.add_response(
+        "get_secret_value",
+        {"SecretString": "from-secrets-manager"},
+        {"SecretId": SECRET_ID},
+    )
+    assert config.get_jwt_secret() == "from-secrets-manager"
+    assert config.get_jwt_secret() == "from-secrets-manager"
+    secretsmanager.assert_no_pending_responses()
+
+
+def test_jwt_secret_fetch_failure_is_raised(secretsmanager):
+    secretsmanager.add_client_error("get_secret_value", service_error_code="ResourceNotFoundException")
+    with pytest.raises(ClientError):
+        config.get_jwt_secret()
+
+
+def test_jwt_secret_defaults_to_settings_key():
+    config.get_jwt_secret.cache_clear()
+    assert config.get_jwt_secret() == config.get_settings().JWT_SECRET_KEY
+
+
+def test_importing_modules_does_not_build_settings():
+    # Fresh interpreter: other tests have already built the settings here
+    code = (
+        "import app.core.security, app.core.deps, app.utils.pdf_report, app.routers.health, "
+        "app.routers.expenses, app.routers.reports, app.routers.notifications, app.routers.settings\n"
+        "from app.core.config import get_settings\n"
+        "assert get_settings.cache_info().currsize == 0"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
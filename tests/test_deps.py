@@ -0,0 +1,34 @@
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.deps import get_current_user_id
+from app.core.security import create_access_token
+
+app = FastAPI()
+
+
+@app.get("/whoami")
+def whoami(user_id: str = Depends(get_current_user_id)):
+    return {"user_id": user_id}
+
+
+client = TestClient(app)
+
+
+def test_bearer_token_resolves_user_id():
+    token = create_access_token({"sub": "user-1"})
+    response = client.get("/whoami", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert response.json() == {"user_id": "user-1"}
+
+
+def test_missing_or_malformed_header_is_rejected():
+    token = create_access_token({"sub": "user-1"})
+    assert client.get("/whoami").status_code == 401
+    assert client.get("/whoami", headers={"Authorization": token}).status_code == 401
+
+
+def test_token_without_subject_is_rejected():
+    token = create_access_token({"email": "someone@example.com"})
+    response = client.get("/whoami", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 401
@@ -0,0 +1,27 @@
+from app.models.expense import ExpenseCreate, ExpenseInDB, ExpenseUpdate, new_expense_id
+
+
+def test_amount_rounded_to_cents():
+    assert ExpenseCreate(category="Food", amount=12.345).amount == 12.35
+    assert ExpenseCreate(category="Food", amount=0.1 + 0.2).amount == 0.3
+    assert ExpenseInDB(user_id="u", category="Food", amount=9.999).amount == 10.0
+
+
+def test_amount_rounds_half_up_on_decimal_value():
+    assert ExpenseCreate(category="Food", amount=1.005).amount == 1.01
+    assert ExpenseCreate(category="Food", amount=2.675).amount == 2.68
+    assert ExpenseCreate(category="Food", amount=0.125).amount == 0.13
+    assert ExpenseUpdate(amount=2.675).amount == 2.68
+
+
+def test_update_without_amount_keeps_it_unset():
+    update = ExpenseUpdate(category="Rent")
+    assert update.amount is None
+    assert "amount" not in update.dict(exclude_unset=True)
+
+
+def test_expense_ids_unique_within_month_prefix():
+    first = ExpenseInDB(user_id="u", category="Food", amount=1)
+    second = ExpenseInDB(user_id="u", category="Food", amount=1)
+    assert first.expense_id != second.expense_id
+    assert new_expense_id("2025-11-01T10:00:00").startswith("2025-11")
@@ -0,0 +1,20 @@
+from collections import Counter
+
+from fastapi.routing import APIRoute
+
+from app.main import app
+from app.routers import settings
+
+
+def _route_keys(routes):
+    return [(route.path, method) for route in routes if isinstance(route, APIRoute) for method in route.methods]
+
+
+def test_no_route_registered_twice():
+    duplicates = [key for key, count in Counter(_route_keys(app.routes)).items() if count > 1]
+    assert duplicates == []
+
+
+def test_settings_router_registered_once():
+    settings_routes = [key for key in _route_keys(app.routes) if key[0].startswith("/api/settings/")]
+    assert len(settings_routes) == len(_route_keys(settings.router.routes))
@@ -0,0 +1,26 @@
+from botocore.stub import ANY, Stubber
+
+from app.db import dynamo
+
+
+def test_backfill_sets_index_key_for_enabled_users():
+    client = dynamo._client()
+    with Stubber(client) as stubber:
+        stubber.add_response("scan", {"Items": [{"user_id": {"S": "u1"}}, {"user_id": {"S": "u2"}}]})
+        stubber.add_response(
+            "update_item",
+            {},
+            {
+                "TableName": ANY,
+                "Key": {"user_id": "u1"},
+                "UpdateExpression": "SET #key = :index_value",
+                "ConditionExpression": "scheduler_enabled = :true",
+                "ExpressionAttributeNames": {"#key": dynamo.SCHEDULER_ENABLED_INDEX_KEY},
+                "ExpressionAttributeValues": {":true": True, ":index_value": dynamo.SCHEDULER_ENABLED_INDEX_VALUE},
+            },
+        )
+        # u2 disabled the scheduler between the scan and the update
+        stubber.add_client_error("update_item", service_error_code="ConditionalCheckFailedException")
+
+        assert dynamo.backfill_scheduler_enabled_index() == 1
+        stubber.assert_no_pending_responses()
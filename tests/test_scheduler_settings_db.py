@@ -0,0 +1,109 @@
+from unittest import mock
+
+import pytest
+from botocore.stub import ANY, Stubber
+
+from app.db import dynamo
+
+NOW = "2025-11-01T00:00:00"
+
+
+@pytest.fixture
+def stubber():
+    dynamo._scheduler_settings_cache.clear()
+    with mock.patch.object(dynamo, "utc_now_iso_seconds", return_value=NOW), \
+            Stubber(dynamo._client()) as stub:
+        yield stub
+        stub.assert_no_pending_responses()
+    dynamo._scheduler_settings_cache.clear()
+
+
+def _expected_update(update_expression, values):
+    return {
+        "TableName": ANY,
+        "Key": {"user_id": "user-1"},
+        "UpdateExpression": update_expression,
+        "ConditionExpression": "attribute_exists(user_id)",
+        "ExpressionAttributeValues": values,
+        "ReturnValues": "UPDATED_NEW",
+    }
+
+
+_ENABLED_DEFAULTS = (
+    "SET scheduler_day = if_not_exists(scheduler_day, :day), "
+    "scheduler_hour = if_not_exists(scheduler_hour, :hour), "
+    "scheduler_minute = if_not_exists(scheduler_minute, :minute), "
+    "scheduler_enabled = :enabled, updated_at = :updated_at"
+)
+_DEFAULT_VALUES = {":day": 1, ":hour": 6, ":minute": 0, ":updated_at": NOW}
+
+
+def _updated_attributes(enabled):
+    return {
+        "Attributes": {
+            "scheduler_day": {"N": "1"},
+            "scheduler_hour": {"N": "6"},
+            "scheduler_minute": {"N": "0"},
+            "scheduler_enabled": {"BOOL": enabled},
+        }
+    }
+
+
+def test_enable_sets_gsi_key_and_defaults(stubber):
+    stubber.add_response(
+        "update_item",
+        _updated_attributes(True),
+        _expected_update(
+            _ENABLED_DEFAULTS + f", {dynamo.SCHEDULER_ENABLED_INDEX_KEY} = :index_value",
+            {**_DEFAULT_VALUES, ":enabled": True, ":index_value": dynamo.SCHEDULER_ENABLED_INDEX_VALUE},
+        ),
+    )
+    assert dynamo.set_scheduler_enabled("user-1", True) is True
+    assert dynamo.get_scheduler_settings_if_cached("user-1") == {"day": 1, "hour": 6, "minute": 0, "enabled": True}
+
+
+def test_disable_removes_gsi_key(stubber):
+    stubber.add_response(
+        "update_item",
+        _updated_attributes(False),
+        _expected_update(
+            _ENABLED_DEFAULTS + f" REMOVE {dynamo.SCHEDULER_ENABLED_INDEX_KEY}",
+            {**_DEFAULT_VALUES, ":enabled": False},
+        ),
+    )
+    assert dynamo.set_scheduler_enabled("user-1", False) is True
+    assert dynamo.get_scheduler_settings_if_cached("user-1")["enabled"] is False
+
+
+def test_enable_for_missing_user_is_not_cached(stubber):
+    stubber.add_client_error("update_item", service_error_code="ConditionalCheckFailedException")
+    assert dynamo.set_scheduler_enabled("user-1", True) is False
+    assert dynamo.get_scheduler_settings_if_cached("user-1") is None
+
+
+def test_schedule_update_keeps_enabled_flag(stubber):
+    stubber.add_response(
+        "update_item",
+        {
+            "Attributes": {
+                "scheduler_day": {"N": "15"},
+                "scheduler_hour": {"N": "9"},
+                "scheduler_minute": {"N": "30"},
+                "scheduler_enabled": {"BOOL": True},
+            }
+        },
+        _expected_update(
+            "SET scheduler_day = :day, scheduler_hour = :hour, scheduler_minute = :minute, "
+            "scheduler_enabled = if_not_exists(scheduler_enabled, :enabled), updated_at = :updated_at",
+            {":day": 15, ":hour": 9, ":minute": 30, ":enabled": False, ":updated_at": NOW},
+        ),
+    )
+    settings = dynamo.update_schedule_fields("user-1", 15, 9, 30)
+    assert settings == {"day": 15, "hour": 9, "minute": 30, "enabled": True}
+    assert dynamo.get_scheduler_settings_if_cached("user-1") == settings
+
+
+def test_schedule_update_for_missing_user_returns_none(stubber):
+    stubber.add_client_error("update_item", service_error_code="ConditionalCheckFailedException")
+    assert dynamo.update_schedule_fields("user-1", 15, 9, 30) is None
+    assert dynamo.get_scheduler_settings_if_cached("user-1") is None
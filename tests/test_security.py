@@ -0,0 +1,30 @@
+import hashlib
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+
+from app.core import security
+from app.core.security import create_access_token, decode_access_token_cached
+
+
+def test_cached_decode_returns_payload():
+    token = create_access_token({"sub": "user-1"})
+    assert decode_access_token_cached(token)["sub"] == "user-1"
+    assert decode_access_token_cached(token)["sub"] == "user-1"
+
+
+def test_cached_decode_rejects_invalid_token():
+    with pytest.raises(HTTPException):
+        decode_access_token_cached("not-a-token")
+
+
+def test_cached_decode_rejects_expired_token():
+    # Token already past its exp, with its payload cached as if it had been
+    # decoded while still valid
+    token = create_access_token({"sub": "user-1"}, expires_delta=timedelta(seconds=-10))
+    payload = jwt.get_unverified_claims(token)
+    security._decoded_tokens.set(hashlib.blake2b(token.encode(), digest_size=16).digest(), payload)
+    with pytest.raises(HTTPException):
+        decode_access_token_cached(token)
@@ -0,0 +1,30 @@
+import pytest
+from pydantic import ValidationError
+
+from app.routers.settings import BudgetThresholdsUpdate, SchedulerScheduleUpdate
+
+
+def test_thresholds_accept_non_negative_amounts():
+    update = BudgetThresholdsUpdate(thresholds={"Food": 200, "Travel": 0})
+    assert update.thresholds == {"Food": 200.0, "Travel": 0.0}
+
+
+def test_thresholds_reject_negative_amount():
+    with pytest.raises(ValidationError, match="Threshold for Travel must be positive"):
+        BudgetThresholdsUpdate(thresholds={"Food": 200, "Travel": -5})
+
+
+def test_schedule_accepts_bounds():
+    schedule = SchedulerScheduleUpdate(day=31, hour=23, minute=59)
+    assert (schedule.day, schedule.hour, schedule.minute) == (31, 23, 59)
+
+
+@pytest.mark.parametrize("fields", [
+    {"day": 0, "hour": 0, "minute": 0},
+    {"day": 32, "hour": 0, "minute": 0},
+    {"day": 1, "hour": 24, "minute": 0},
+    {"day": 1, "hour": 0, "minute": 60},
+])
+def test_schedule_rejects_out_of_range(fields):
+    with pytest.raises(ValidationError):
+        SchedulerScheduleUpdate(**fields)
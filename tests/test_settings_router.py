@@ -0,0 +1,46 @@
+from unittest import mock
+
+from fastapi.testclient import TestClient
+
+from app.core.security import create_access_token
+from app.db import dynamo
+from app.main import app
+from app.routers import settings
+
+# No `with`: the lifespan (scheduler, DynamoDB warm-up) is not started
+client = TestClient(app)
+HEADERS = {"Authorization": f"Bearer {create_access_token({'sub': 'user-1'})}"}
+
+
+def test_thresholds_served_from_cache_without_dynamo_read():
+    with mock.patch.object(dynamo, "get_budget_thresholds_if_cached", return_value={"Food": 200}), \
+            mock.patch.object(dynamo, "get_budget_thresholds") as read:
+        response = client.get("/api/settings/thresholds", headers=HEADERS)
+    assert response.status_code == 200
+    assert response.json() == {"thresholds": {"Food": 200}}
+    read.assert_not_called()
+
+
+def test_thresholds_etag_returns_304_when_unchanged():
+    with mock.patch.object(dynamo, "get_budget_thresholds_if_cached", return_value={"Food": 200}):
+        etag = client.get("/api/settings/thresholds", headers=HEADERS).headers["etag"]
+        response = client.get("/api/settings/thresholds", headers={**HEADERS, "If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_start_always_writes_enabled_flag():
+    with mock.patch.object(dynamo, "set_scheduler_enabled", return_value=True) as write, \
+            mock.patch.object(settings, "get_running_scheduler", return_value=object()):
+        for _ in range(2):
+            assert client.post("/api/settings/scheduler/start", headers=HEADERS).status_code == 200
+    assert write.call_args_list == [mock.call("user-1", True)] * 2
+
+
+def test_schedule_update_failure_is_500():
+    with mock.patch.object(dynamo, "update_schedule_fields", return_value=None):
+        response = client.put(
+            "/api/settings/scheduler/schedule",
+            headers=HEADERS,
+            json={"day": 1, "hour": 6, "minute": 0},
+        )
+    assert response.status_code == 500
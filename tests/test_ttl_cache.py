@@ -0,0 +1,115 @@
+import threading
+import time
+
+from app.utils.ttl_cache import TTLCache
+
+
+def test_get_or_load_caches_until_expiry():
+    cache = TTLCache(ttl=0.05)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {"day": 1}
+
+    assert cache.get_or_load("u1", loader) == {"day": 1}
+    assert cache.get_or_load("u1", loader) == {"day": 1}
+    assert len(calls) == 1
+
+    time.sleep(0.06)
+    cache.get_or_load("u1", loader)
+    assert len(calls) == 2
+
+
+def test_none_is_not_cached():
+    cache = TTLCache(ttl=60)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return None
+
+    assert cache.get_or_load("missing", loader) is None
+    assert cache.get_or_load("missing", loader) is None
+    assert len(calls) == 2
+
+
+def test_pop_invalidates_entry():
+    cache = TTLCache(ttl=60)
+    cache.set("u1", "old")
+    cache.pop("u1")
+    assert cache.get_or_load("u1", lambda: "new") == "new"
+
+
+def test_stale_value_served_while_refreshing():
+    cache = TTLCache(ttl=0.01, stale_ttl=60)
+    cache.set("u1", "old")
+    time.sleep(0.02)
+
+    assert cache.get_or_load("u1", lambda: "new") == "old"
+    for _ in range(100):
+        if cache.get("u1") == "new":
+            break
+        time.sleep(0.01)
+    assert cache.get("u1") == "new"
+
+
+def test_oldest_entry_evicted_at_maxsize():
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.get("a") is None
+    assert cache.get("c") == 3
+
+
+def test_concurrent_misses_share_one_load():
+    cache = TTLCache(ttl=60)
+    calls = []
+    release = threading.Event()
+
+    def loader():
+        calls.append(1)
+        release.wait(1)
+        return "value"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load("u1", loader))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+
+
+def test_versions_do_not_grow_under_pop_churn():
+    cache = TTLCache(ttl=60, maxsize=4)
+    cache.set("kept", 1)
+    for i in range(10_000):
+        cache.pop(f"never-cached-{i}")
+    cache.clear()
+    assert cache._versions == {}
+
+
+def test_pop_during_load_discards_its_result():
+    cache = TTLCache(ttl=60)
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_loader():
+        started.set()
+        release.wait(timeout=5)
+        return "stale"
+
+    loader_thread = threading.Thread(target=cache.get_or_load, args=("u1", slow_loader))
+    loader_thread.start()
+    started.wait(timeout=5)
+    cache.pop("u1")
+    release.set()
+    loader_thread.join(timeout=5)
+
+    assert cache.get("u1") is None